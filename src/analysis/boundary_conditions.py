@@ -60,6 +60,93 @@ class BoundaryConditionProperties:
     mode_shapes: List[str]  # Typical mode shapes
     special_notes: str
 
+# Factor tables are fixed, so they are built once at import rather than on
+# every lookup
+_UNIT_STIFFNESS_FACTORS = {"kxx": 1.0, "kyy": 1.0, "kxy": 1.0}
+
+# Base factors based on boundary condition characteristics
+_STIFFNESS_FACTORS = {
+    BoundaryCondition.SSSS: {"kxx": 1.0, "kyy": 1.0, "kxy": 1.0},
+    BoundaryCondition.CCCC: {"kxx": 2.56, "kyy": 2.56, "kxy": 1.8},
+    BoundaryCondition.CFFF: {"kxx": 0.25, "kyy": 0.1, "kxy": 0.2},
+    BoundaryCondition.CSSS: {"kxx": 1.8, "kyy": 1.2, "kxy": 1.1},
+    BoundaryCondition.CCSS: {"kxx": 2.0, "kyy": 1.5, "kxy": 1.3},
+    BoundaryCondition.CFCF: {"kxx": 1.5, "kyy": 0.8, "kxy": 0.9},
+    BoundaryCondition.SSSF: {"kxx": 0.7, "kyy": 1.0, "kxy": 0.8},  # Reduced chordwise stiffness
+    BoundaryCondition.CCCF: {"kxx": 1.6, "kyy": 2.2, "kxy": 1.4},  # High spanwise, reduced chordwise
+    BoundaryCondition.SFSS: {"kxx": 0.7, "kyy": 1.0, "kxy": 0.8},  # Similar to SSSF - reduced chordwise stiffness
+    BoundaryCondition.CFCC: {"kxx": 1.6, "kyy": 2.2, "kxy": 1.4},  # Similar to CCCF - high spanwise, reduced chordwise
+    BoundaryCondition.FFFF: {"kxx": 0.05, "kyy": 0.05, "kxy": 0.05}
+}
+
+# Natural frequency factors relative to SSSS condition
+# Based on classical plate theory solutions
+_NATURAL_FREQUENCY_FACTORS = {
+    BoundaryCondition.SSSS: {
+        (1, 1): 1.0,
+        (1, 2): 2.25,
+        (2, 1): 2.25,
+        (2, 2): 4.0,
+        (1, 3): 4.84,
+        (3, 1): 4.84
+    },
+    BoundaryCondition.CCCC: {
+        (1, 1): 1.596,
+        (1, 2): 2.93,
+        (2, 1): 2.93,
+        (2, 2): 4.64,
+        (1, 3): 5.78,
+        (3, 1): 5.78
+    },
+    BoundaryCondition.CFFF: {
+        (1, 0): 0.160,  # First bending mode
+        (2, 0): 1.004,  # Second bending mode
+        (3, 0): 2.790,  # Third bending mode
+        (0, 1): 0.455,  # First torsion mode
+        (1, 1): 0.582
+    },
+    BoundaryCondition.CSSS: {
+        (1, 1): 1.248,
+        (1, 2): 2.68,
+        (2, 1): 2.68,
+        (2, 2): 4.32
+    },
+    BoundaryCondition.CCSS: {
+        (1, 1): 1.435,
+        (1, 2): 2.87,
+        (2, 1): 3.24,
+        (2, 2): 4.58
+    },
+    BoundaryCondition.SSSF: {
+        (1, 1): 0.895,  # Lower than SSSS due to free trailing edge
+        (1, 2): 2.01,   # Reduced stiffness in chordwise direction
+        (2, 1): 2.12,   # Spanwise modes less affected
+        (2, 2): 3.65,   # Combined mode reduced
+        (1, 0): 0.354   # Chordwise bending mode
+    },
+    BoundaryCondition.CCCF: {
+        (1, 1): 1.127,  # Between CCCC and SSSF
+        (1, 2): 2.45,   # Reduced from CCCC due to free trailing edge
+        (2, 1): 2.89,   # Spanwise modes closer to CCCC
+        (2, 2): 4.12,   # Combined mode
+        (1, 0): 0.428   # Chordwise bending mode with clamped sides
+    },
+    BoundaryCondition.SFSS: {
+        (1, 1): 0.895,  # Similar to SSSF due to free trailing edge
+        (1, 2): 2.01,   # Reduced stiffness in chordwise direction
+        (2, 1): 2.12,   # Spanwise modes less affected
+        (2, 2): 3.65,   # Combined mode reduced
+        (1, 0): 0.354   # Chordwise bending mode
+    },
+    BoundaryCondition.CFCC: {
+        (1, 1): 1.127,  # Similar to CCCF - between CCCC and free trailing conditions
+        (1, 2): 2.45,   # Reduced from CCCC due to free trailing edge
+        (2, 1): 2.89,   # Spanwise modes closer to CCCC due to clamped sides
+        (2, 2): 4.12,   # Combined mode
+        (1, 0): 0.428   # Chordwise bending mode with clamped sides
+    }
+}
+
 class BoundaryConditionManager:
     """Manages boundary conditions and their properties"""
     
@@ -281,101 +368,15 @@ class BoundaryConditionManager:
         
         bc_props = self.get_boundary_condition(bc_type)
         if not bc_props:
-            return {"kxx": 1.0, "kyy": 1.0, "kxy": 1.0}
-        
-        # Base factors based on boundary condition characteristics
-        stiffness_factors = {
-            BoundaryCondition.SSSS: {"kxx": 1.0, "kyy": 1.0, "kxy": 1.0},
-            BoundaryCondition.CCCC: {"kxx": 2.56, "kyy": 2.56, "kxy": 1.8},
-            BoundaryCondition.CFFF: {"kxx": 0.25, "kyy": 0.1, "kxy": 0.2},
-            BoundaryCondition.CSSS: {"kxx": 1.8, "kyy": 1.2, "kxy": 1.1},
-            BoundaryCondition.CCSS: {"kxx": 2.0, "kyy": 1.5, "kxy": 1.3},
-            BoundaryCondition.CFCF: {"kxx": 1.5, "kyy": 0.8, "kxy": 0.9},
-            BoundaryCondition.SSSF: {"kxx": 0.7, "kyy": 1.0, "kxy": 0.8},  # Reduced chordwise stiffness
-            BoundaryCondition.CCCF: {"kxx": 1.6, "kyy": 2.2, "kxy": 1.4},  # High spanwise, reduced chordwise
-            BoundaryCondition.SFSS: {"kxx": 0.7, "kyy": 1.0, "kxy": 0.8},  # Similar to SSSF - reduced chordwise stiffness
-            BoundaryCondition.CFCC: {"kxx": 1.6, "kyy": 2.2, "kxy": 1.4},  # Similar to CCCF - high spanwise, reduced chordwise
-            BoundaryCondition.FFFF: {"kxx": 0.05, "kyy": 0.05, "kxy": 0.05}
-        }
+            return dict(_UNIT_STIFFNESS_FACTORS)
         
-        return stiffness_factors.get(bc_type, {"kxx": 1.0, "kyy": 1.0, "kxy": 1.0})
+        return dict(_STIFFNESS_FACTORS.get(bc_type, _UNIT_STIFFNESS_FACTORS))
     
     def get_natural_frequency_factors(self, bc_type: BoundaryCondition, 
                                     mode: Tuple[int, int] = (1, 1)) -> float:
         """Get natural frequency factors for different boundary conditions and modes"""
         
-        m, n = mode
-        
-        # Natural frequency factors relative to SSSS condition
-        # Based on classical plate theory solutions
-        frequency_factors = {
-            BoundaryCondition.SSSS: {
-                (1, 1): 1.0,
-                (1, 2): 2.25,
-                (2, 1): 2.25,
-                (2, 2): 4.0,
-                (1, 3): 4.84,
-                (3, 1): 4.84
-            },
-            BoundaryCondition.CCCC: {
-                (1, 1): 1.596,
-                (1, 2): 2.93,
-                (2, 1): 2.93,
-                (2, 2): 4.64,
-                (1, 3): 5.78,
-                (3, 1): 5.78
-            },
-            BoundaryCondition.CFFF: {
-                (1, 0): 0.160,  # First bending mode
-                (2, 0): 1.004,  # Second bending mode
-                (3, 0): 2.790,  # Third bending mode
-                (0, 1): 0.455,  # First torsion mode
-                (1, 1): 0.582
-            },
-            BoundaryCondition.CSSS: {
-                (1, 1): 1.248,
-                (1, 2): 2.68,
-                (2, 1): 2.68,
-                (2, 2): 4.32
-            },
-            BoundaryCondition.CCSS: {
-                (1, 1): 1.435,
-                (1, 2): 2.87,
-                (2, 1): 3.24,
-                (2, 2): 4.58
-            },
-            BoundaryCondition.SSSF: {
-                (1, 1): 0.895,  # Lower than SSSS due to free trailing edge
-                (1, 2): 2.01,   # Reduced stiffness in chordwise direction
-                (2, 1): 2.12,   # Spanwise modes less affected
-                (2, 2): 3.65,   # Combined mode reduced
-                (1, 0): 0.354   # Chordwise bending mode
-            },
-            BoundaryCondition.CCCF: {
-                (1, 1): 1.127,  # Between CCCC and SSSF
-                (1, 2): 2.45,   # Reduced from CCCC due to free trailing edge
-                (2, 1): 2.89,   # Spanwise modes closer to CCCC
-                (2, 2): 4.12,   # Combined mode
-                (1, 0): 0.428   # Chordwise bending mode with clamped sides
-            },
-            BoundaryCondition.SFSS: {
-                (1, 1): 0.895,  # Similar to SSSF due to free trailing edge
-                (1, 2): 2.01,   # Reduced stiffness in chordwise direction
-                (2, 1): 2.12,   # Spanwise modes less affected
-                (2, 2): 3.65,   # Combined mode reduced
-                (1, 0): 0.354   # Chordwise bending mode
-            },
-            BoundaryCondition.CFCC: {
-                (1, 1): 1.127,  # Similar to CCCF - between CCCC and free trailing conditions
-                (1, 2): 2.45,   # Reduced from CCCC due to free trailing edge
-                (2, 1): 2.89,   # Spanwise modes closer to CCCC due to clamped sides
-                (2, 2): 4.12,   # Combined mode
-                (1, 0): 0.428   # Chordwise bending mode with clamped sides
-            }
-        }
-        
-        bc_factors = frequency_factors.get(bc_type, {})
-        return bc_factors.get(mode, 1.0)
+        return _NATURAL_FREQUENCY_FACTORS.get(bc_type, {}).get(mode, 1.0)
     
     def validate_boundary_condition(self, bc_type: BoundaryCondition) -> Tuple[bool, List[str]]:
         """Validate boundary condition and return warnings/notes"""
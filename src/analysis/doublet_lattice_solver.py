@@ -17,12 +17,29 @@ import logging
 from typing import Dict, List, Tuple, Optional, NamedTuple
 from dataclasses import dataclass
 import math
+import operator
 
 from .boundary_conditions import BoundaryCondition, BoundaryConditionManager
+from .piston_theory_solver import FlutterResult, PistonTheorySolver, AtmosphereModel
+
+# numba for the doublet influence kernel (plain Python without it)
+from .numba_compat import njit, NUMBA_AVAILABLE
+
+# Import SciPy for the generalized eigensolver (LAPACK ggev)
+try:
+    from scipy.linalg import eig as _scipy_eig
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    logging.warning("SciPy not available - using NumPy eigenvalue fallback")
 
-# Simple implementations to replace scipy dependencies
 def simple_eig(A, B=None):
-    """Simplified eigenvalue solver using numpy"""
+    """Eigenvalue solver - SciPy's generalized solver when available, else NumPy"""
+    if SCIPY_AVAILABLE:
+        # Solves A x = w B x directly without forming inv(B)
+        return _scipy_eig(A, B)
+    
+    # Simple implementation to replace the scipy dependency
     if B is None:
         return np.linalg.eig(A)
     else:
@@ -33,6 +50,51 @@ def simple_eig(A, B=None):
         except:
             return np.linalg.eig(A), None
 
+# Diagonal stiffness scale applied to the nodes of a constrained edge:
+# clamped edges are stiffened, free edges softened (avoiding singularity)
+# and elastic supports moderately stiffened
+_EDGE_STIFFNESS_SCALE = {'C': 10.0, 'F': 0.1, 'E': 2.0}
+
+@njit(cache=True)
+def _doublet_influence(x_recv, y_recv, z_recv, x_src, y_src, z_src, dx, dy, mach, k):
+    """Scalar doublet influence kernel (compiled when numba is available)"""
+    
+    # Prandtl-Glauert transformation
+    beta = np.sqrt(abs(1 - mach**2)) if mach != 1.0 else 0.1
+    
+    # Relative coordinates
+    xi = (x_recv - x_src) / beta
+    eta = y_recv - y_src
+    zeta = z_recv - z_src
+    
+    # Panel corner coordinates in transformed space
+    x1, x2 = -dx/(2*beta), dx/(2*beta)
+    
+    # Distance calculations
+    r1 = np.sqrt((xi - x1)**2 + eta**2 + zeta**2)
+    r2 = np.sqrt((xi - x2)**2 + eta**2 + zeta**2)
+    
+    # Avoid singularities
+    r1 = max(r1, 1e-10)
+    r2 = max(r2, 1e-10)
+    
+    # Basic doublet influence (simplified)
+    if abs(zeta) < 1e-10:  # On panel surface
+        if abs(xi) < dx/(2*beta) and abs(eta) < dy/2:
+            return complex(-0.5)  # Inside panel
+        return complex(0.0)       # Outside panel
+    
+    # 3D influence with oscillatory effects
+    static_influence = (np.arctan2(eta*(xi-x1), zeta*r1) - 
+                        np.arctan2(eta*(xi-x2), zeta*r2)) / (4*np.pi)
+    
+    # Add oscillatory terms for unsteady flow
+    if k > 0:
+        phase_factor = np.exp(1j * k * xi * mach)
+        oscillatory_correction = 1.0 + 1j * k * xi
+        return static_influence * phase_factor * oscillatory_correction
+    return complex(static_influence)
+
 @dataclass
 class DLMParameters:
     """Doublet Lattice Method parameters"""
@@ -68,48 +130,8 @@ class AerodynamicInfluenceCoefficient:
             Complex influence coefficient
         """
         
-        # Prandtl-Glauert transformation
-        beta = np.sqrt(abs(1 - mach**2)) if mach != 1.0 else 0.1
-        
-        # Relative coordinates
-        xi = (x_recv - x_src) / beta
-        eta = y_recv - y_src
-        zeta = z_recv - z_src
-        
-        # Panel corner coordinates in transformed space
-        x1, x2 = -dx/(2*beta), dx/(2*beta)
-        y1, y2 = -dy/2, dy/2
-        
-        # Distance calculations
-        r1 = np.sqrt((xi - x1)**2 + eta**2 + zeta**2)
-        r2 = np.sqrt((xi - x2)**2 + eta**2 + zeta**2)
-        r3 = np.sqrt((xi - x1)**2 + (eta - dy)**2 + zeta**2)
-        r4 = np.sqrt((xi - x2)**2 + (eta - dy)**2 + zeta**2)
-        
-        # Avoid singularities
-        r1 = max(r1, 1e-10)
-        r2 = max(r2, 1e-10)
-        
-        # Basic doublet influence (simplified)
-        if abs(zeta) < 1e-10:  # On panel surface
-            if abs(xi) < dx/(2*beta) and abs(eta) < dy/2:
-                influence = -0.5  # Inside panel
-            else:
-                influence = 0.0   # Outside panel
-        else:
-            # 3D influence with oscillatory effects
-            static_influence = (np.arctan2(eta*(xi-x1), zeta*r1) - 
-                              np.arctan2(eta*(xi-x2), zeta*r2)) / (4*np.pi)
-            
-            # Add oscillatory terms for unsteady flow
-            if k > 0:
-                phase_factor = np.exp(1j * k * xi * mach)
-                oscillatory_correction = 1.0 + 1j * k * xi
-                influence = static_influence * phase_factor * oscillatory_correction
-            else:
-                influence = static_influence
-                
-        return complex(influence)
+        return complex(_doublet_influence(x_recv, y_recv, z_recv, x_src, y_src, z_src,
+                                          dx, dy, mach, k))
 
 class DoubletLatticeSolver:
     """
@@ -129,6 +151,8 @@ class DoubletLatticeSolver:
         
         # Aerodynamic matrices storage
         self.aerodynamic_matrices = {}  # [Q(k,M)] matrices
+        self._available_machs = []      # sorted Mach numbers of the stored matrices
+        self._available_ks = []         # sorted reduced frequencies of the stored matrices
         self.panel_geometry = None
         
     def analyze_flutter(self, panel: 'PanelProperties', 
@@ -147,8 +171,6 @@ class DoubletLatticeSolver:
         Returns:
             List of flutter results
         """
-        from .piston_theory_solver import FlutterResult, AtmosphereModel
-        
         self.logger.info("Starting doublet lattice method flutter analysis")
         
         # Get atmospheric properties
@@ -165,15 +187,18 @@ class DoubletLatticeSolver:
         
         # Flutter analysis
         velocities = np.linspace(velocity_range[0], velocity_range[1], num_points)
+        machs = velocities / sound_speed
+        subsonic = machs < 0.98
         results = []
         
-        for V in velocities:
-            mach = V / sound_speed
-            
-            if mach >= 0.98:
-                self.logger.warning(f"DLM not accurate for transonic M={mach:.2f}")
-                continue
-                
+        if not subsonic.all():
+            transonic = machs[~subsonic]
+            self.logger.warning(
+                f"DLM not accurate for transonic M={transonic.min():.2f}-{transonic.max():.2f}, "
+                f"skipping {transonic.size} velocities"
+            )
+        
+        for V, mach in zip(velocities[subsonic], machs[subsonic]):
             # Solve flutter equation for this velocity
             flutter_result = self._solve_flutter_equation(
                 panel, structural_matrices, V, mach, rho_air, sound_speed
@@ -184,7 +209,7 @@ class DoubletLatticeSolver:
         
         # Filter and sort results
         flutter_results = [r for r in results if r.damping < 0]  # Unstable modes
-        flutter_results.sort(key=lambda x: x.flutter_speed)
+        flutter_results.sort(key=operator.attrgetter('flutter_speed'))
         
         self.logger.info(f"DLM found {len(flutter_results)} flutter points")
         return flutter_results
@@ -261,6 +286,10 @@ class DoubletLatticeSolver:
                 # Store matrix
                 self.aerodynamic_matrices[(mach, k)] = Q_matrix
         
+        # Keys only change here, so the lookup tables are built once per generation
+        self._available_machs = sorted(set(m for m, _ in self.aerodynamic_matrices.keys()))
+        self._available_ks = sorted(set(k_val for _, k_val in self.aerodynamic_matrices.keys()))
+        
         self.logger.info(f"Generated {len(self.aerodynamic_matrices)} aerodynamic matrices")
     
     def _calculate_structural_matrices(self, panel: 'PanelProperties') -> Dict[str, np.ndarray]:
@@ -324,56 +353,33 @@ class DoubletLatticeSolver:
         # Get boundary node lists
         boundary_nodes = self._get_boundary_nodes(nx, ny, edge_constraints)
         
-        # Apply constraints based on edge types
+        # Scale the diagonal stiffness of each constrained edge in one step;
+        # simply supported edges need no modification
         for edge_name, constraint in edge_constraints.items():
-            nodes = boundary_nodes[edge_name]
-            
-            for node in nodes:
-                if constraint.value == 'C':  # Clamped
-                    # High stiffness for clamped nodes
-                    K[node, node] *= 10.0
-                elif constraint.value == 'F':  # Free
-                    # Reduce constraints for free edges (but avoid singularity)
-                    K[node, node] *= 0.1
-                elif constraint.value == 'S':  # Simply supported
-                    # Standard boundary condition (no modification needed)
-                    pass
-                elif constraint.value == 'E':  # Elastic
-                    # Moderate stiffness for elastic support
-                    K[node, node] *= 2.0
+            scale = _EDGE_STIFFNESS_SCALE.get(constraint.value)
+            if scale is not None:
+                nodes = boundary_nodes[edge_name]
+                K[nodes, nodes] *= scale
         
         self.logger.debug(f"Applied {bc_props.name if bc_props else 'unknown'} boundary conditions")
     
     def _get_boundary_nodes(self, nx: int, ny: int, edge_constraints: dict) -> dict:
-        """Get lists of nodes on each boundary edge"""
+        """Get arrays of nodes on each boundary edge"""
         
+        # Node numbering is i * (ny + 1) + j, so each edge is an arithmetic sequence
+        edge = np.arange(ny + 1)
+        interior = np.arange(1, nx) * (ny + 1)
         boundary_nodes = {
-            'leading': [],   # x = 0 edge
-            'trailing': [],  # x = L edge  
-            'left': [],      # y = 0 edge
-            'right': []      # y = W edge
+            # Leading edge (x = 0, i = 0)
+            'leading': edge,
+            # Trailing edge (x = L, i = nx)
+            'trailing': nx * (ny + 1) + edge,
+            # Left edge (y = 0, j = 0) - excluding corners already added
+            'left': interior,
+            # Right edge (y = W, j = ny) - excluding corners already added
+            'right': interior + ny
         }
         
-        # Leading edge (x = 0, i = 0)
-        for j in range(ny + 1):
-            node = 0 * (ny + 1) + j
-            boundary_nodes['leading'].append(node)
-            
-        # Trailing edge (x = L, i = nx)
-        for j in range(ny + 1):
-            node = nx * (ny + 1) + j
-            boundary_nodes['trailing'].append(node)
-            
-        # Left edge (y = 0, j = 0)  
-        for i in range(1, nx):  # Exclude corners already added
-            node = i * (ny + 1) + 0
-            boundary_nodes['left'].append(node)
-            
-        # Right edge (y = W, j = ny)
-        for i in range(1, nx):  # Exclude corners already added
-            node = i * (ny + 1) + ny
-            boundary_nodes['right'].append(node)
-        
         return boundary_nodes
     
     def _solve_flutter_equation(self, panel: 'PanelProperties',
@@ -386,8 +392,6 @@ class DoubletLatticeSolver:
         Equation: [K - ω²M + iω²ρV²/q * Q(k)] φ = 0
         where q = dynamic pressure, k = ωc/(2V)
         """
-        from .piston_theory_solver import FlutterResult
-        
         results = []
         M, K = structural_matrices['M'], structural_matrices['K']
         
@@ -395,6 +399,10 @@ class DoubletLatticeSolver:
         ref_chord = panel.length
         dynamic_pressure = 0.5 * rho_air * velocity**2
         
+        # Independent of the reduced frequency - computed once per velocity
+        aero_scaling = dynamic_pressure / (ref_chord * panel.width)
+        omega_initial = np.sqrt(np.real(K[0,0] / M[0,0]))  # First natural frequency
+        
         # Try different reduced frequencies
         for k in [0.1, 0.3, 0.5, 0.8, 1.0]:
             
@@ -413,10 +421,8 @@ class DoubletLatticeSolver:
                 # (K - ω²M + iω²ρV²/q * Q) φ = 0
                 # Rearrange: (K + iω²ρV²/q * Q) φ = ω²M φ
                 
-                aero_scaling = dynamic_pressure / (ref_chord * panel.width)
-                
                 # Frequency iteration (simplified K-method)
-                omega_guess = np.sqrt(np.real(K[0,0] / M[0,0]))  # First natural frequency
+                omega_guess = omega_initial
                 
                 for iteration in range(10):  # Iterate to converge
                     
@@ -482,13 +488,9 @@ class DoubletLatticeSolver:
     def _interpolate_aerodynamic_matrix(self, mach: float, k: float) -> Optional[np.ndarray]:
         """Interpolate aerodynamic matrix for given Mach and reduced frequency"""
         
-        # Find closest stored values
-        available_machs = sorted(set(m for m, _ in self.aerodynamic_matrices.keys()))
-        available_ks = sorted(set(k_val for _, k_val in self.aerodynamic_matrices.keys()))
-        
         # Simple nearest neighbor for now (could improve with interpolation)
-        closest_mach = min(available_machs, key=lambda m: abs(m - mach))
-        closest_k = min(available_ks, key=lambda k_val: abs(k_val - k))
+        closest_mach = min(self._available_machs, key=lambda m: abs(m - mach))
+        closest_k = min(self._available_ks, key=lambda k_val: abs(k_val - k))
         
         if (closest_mach, closest_k) in self.aerodynamic_matrices:
             return self.aerodynamic_matrices[(closest_mach, closest_k)]
@@ -499,8 +501,6 @@ class DoubletLatticeSolver:
                                   flow: 'FlowConditions') -> Dict[str, List['FlutterResult']]:
         """Compare DLM results with piston theory"""
         
-        from .piston_theory_solver import PistonTheorySolver
-        
         # Run both analyses
         dlm_results = self.analyze_flutter(panel, flow)
         
@@ -12,6 +12,7 @@ Provides solver selection, comparison, and validation capabilities.
 
 import numpy as np
 import logging
+import math
 from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
@@ -520,7 +521,6 @@ class MultiSolverAnalyzer:
         
         # Frequency range based on panel properties
         # Rough estimate of first natural frequency
-        import math
         D = (panel.youngs_modulus * panel.thickness**3) / (12 * (1 - panel.poissons_ratio**2))
         rho = panel.density * panel.thickness
         f1_approx = (math.pi**2 / (2 * panel.length**2)) * math.sqrt(D / rho) / (2 * math.pi)
@@ -172,35 +172,32 @@ class NastranBDFGenerator:
         """Add structural grid and elements"""
         self.cards.append("$ Grid points")
         
-        grid_id = 1
         dx = length / nx
         dy = width / ny
         
-        # Grid points
-        for i in range(nx + 1):
-            for j in range(ny + 1):
-                x = i * dx
-                y = j * dy
-                z = 0.0
-                self.cards.append(
-                    f"GRID    {grid_id:<8d}        {x:<8.4f}{y:<8.4f}{z:<8.4f}"
-                )
-                grid_id += 1
+        # Grid points, numbered along y first; all cards are formatted in
+        # one pass instead of one f-string per node
+        i, j = np.meshgrid(np.arange(nx + 1), np.arange(ny + 1), indexing='ij')
+        num_grids = i.size
+        grids = np.column_stack([np.arange(1, num_grids + 1), i.ravel() * dx,
+                                 j.ravel() * dy, np.zeros(num_grids)])
+        self.cards.append(
+            "\n".join(["GRID    %-8d        %-8.4f%-8.4f%-8.4f"] * num_grids)
+            % tuple(grids.ravel().tolist())
+        )
         
         self.cards.append("$ Shell elements")
         
         # CQUAD4 elements
-        elem_id = 1
-        for i in range(nx):
-            for j in range(ny):
-                n1 = i * (ny + 1) + j + 1
-                n2 = n1 + 1
-                n3 = (i + 1) * (ny + 1) + j + 2
-                n4 = n3 - 1
-                self.cards.append(
-                    f"CQUAD4  {elem_id:<8d}1       {n1:<8d}{n2:<8d}{n3:<8d}{n4:<8d}"
-                )
-                elem_id += 1
+        i, j = np.meshgrid(np.arange(nx), np.arange(ny), indexing='ij')
+        n1 = (i * (ny + 1) + j + 1).ravel()
+        n3 = ((i + 1) * (ny + 1) + j + 2).ravel()
+        num_elems = n1.size
+        quads = np.column_stack([np.arange(1, num_elems + 1), n1, n1 + 1, n3, n3 - 1])
+        self.cards.append(
+            "\n".join(["CQUAD4  %-8d1       %-8d%-8d%-8d%-8d"] * num_elems)
+            % tuple(quads.ravel().tolist())
+        )
         
         self.cards.append("$")
     
@@ -209,25 +206,18 @@ class NastranBDFGenerator:
         self.cards.append("$ Boundary conditions - Simply supported")
         
         # Fix Z displacement on all edges for simply supported
-        # Left edge (x=0)
-        for j in range(ny + 1):
-            grid_id = j + 1
-            self.cards.append(f"SPC1    1       3       {grid_id}")
-        
-        # Right edge (x=L)
-        for j in range(ny + 1):
-            grid_id = nx * (ny + 1) + j + 1
-            self.cards.append(f"SPC1    1       3       {grid_id}")
-        
-        # Bottom edge (y=0)
-        for i in range(1, nx):  # Skip corners
-            grid_id = i * (ny + 1) + 1
-            self.cards.append(f"SPC1    1       3       {grid_id}")
-        
-        # Top edge (y=W)
-        for i in range(1, nx):  # Skip corners
-            grid_id = i * (ny + 1) + ny + 1
-            self.cards.append(f"SPC1    1       3       {grid_id}")
+        edge_rows = np.arange(ny + 1)
+        inner_columns = np.arange(1, nx) * (ny + 1)  # Skip corners
+        grid_ids = np.concatenate([
+            edge_rows + 1,                      # Left edge (x=0)
+            nx * (ny + 1) + edge_rows + 1,      # Right edge (x=L)
+            inner_columns + 1,                  # Bottom edge (y=0)
+            inner_columns + ny + 1,             # Top edge (y=W)
+        ])
+        self.cards.append(
+            "\n".join(["SPC1    1       3       %d"] * len(grid_ids))
+            % tuple(grid_ids.tolist())
+        )
         
         self.cards.append("$")
     
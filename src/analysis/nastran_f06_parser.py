@@ -5,14 +5,51 @@ Enhanced NASTRAN F06 Parser for Flutter Analysis
 Robust parser for NASTRAN .f06 output files with proper FlutterResult objects.
 """
 
+import io
+import itertools
+import mmap
+import operator
+import os
 import re
+import sys
 import numpy as np
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Tuple
+from typing import Iterable, List, Optional, Dict, Tuple, Union
 import logging
 
-@dataclass
+# Flutter summary header fields, compiled once at import
+_MACH_RE = re.compile(r'MACH NUMBER\s*=\s*([\d.E+-]+)')
+_DENSITY_RATIO_RE = re.compile(r'DENSITY RATIO\s*=\s*([\d.E+-]+)')
+_POINT_RE = re.compile(r'POINT\s*=\s*(\d+)')
+_METHOD_RE = re.compile(r'METHOD\s*=\s*(\w+)')
+
+# Carriage return not followed by a line feed (old Mac line endings)
+_LONE_CR_RE = re.compile(rb'\r(?!\n)')
+# A flutter summary never extends beyond this many lines from its header
+_SECTION_LINES = 65
+# Lines skipped after a header before looking for the next one
+_SECTION_SKIP = 20
+
+# Dynamic pressure per unit V^2 at sea-level density (0.5 * rho0)
+_HALF_RHO0 = 0.5 * 1.225
+
+# Flutter summary data row: KFREQ  1./KFREQ  VELOCITY  DAMPING  FREQUENCY  REAL  IMAG.
+# Rows with 7+ columns carry velocity, damping and frequency in columns 3-5;
+# the 5-6 column alternative format has them in columns 2-4. Header (KFREQ)
+# rows and rows flagged with '*' in the first column are not matched.
+_NUM = r'[-+]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|(?i:nan|inf(?:inity)?))'
+_FLUTTER_ROW_RE = re.compile(
+    rf'^[ \t]*(?![^\n]*KFREQ)[^\s*]+[ \t]+'
+    rf'(?:\S+[ \t]+({_NUM})[ \t]+({_NUM})[ \t]+({_NUM})(?:[ \t]+\S+){{2,}}'
+    rf'|({_NUM})[ \t]+({_NUM})[ \t]+({_NUM})(?:[ \t]+\S+){{1,2}})[ \t]*$',
+    re.MULTILINE
+)
+
+# Slotted results carry no per-instance __dict__ (dataclass slots need Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class FlutterResult:
     """Results from flutter analysis - compatible with existing code"""
     flutter_speed: float  # m/s (velocity)
@@ -23,6 +60,27 @@ class FlutterResult:
     mach_number: float = 0.0
     dynamic_pressure: float = 0.0
 
+def _decode_lines(data: bytes) -> List[str]:
+    """Decode F06 bytes into lines the way text-mode readlines() would"""
+    return io.StringIO(data.decode('utf-8', errors='ignore'), newline=None).readlines()
+
+def _is_eigenvalue_header(line: str) -> bool:
+    """Whether a line is the column heading of an eigenvalue summary"""
+    return 'EIGENVALUE' in line and 'CYCLES' in line
+
+def _summary_header_offsets(mm: Union[mmap.mmap, bytes]):
+    """Yield start offsets of lines containing both FLUTTER and SUMMARY"""
+    size = len(mm)
+    pos = mm.find(b'SUMMARY')
+    while pos >= 0:
+        line_start = mm.rfind(b'\n', 0, pos) + 1
+        line_end = mm.find(b'\n', pos)
+        if line_end < 0:
+            line_end = size
+        if mm.find(b'FLUTTER', line_start, line_end) >= 0:
+            yield line_start
+        pos = mm.find(b'SUMMARY', line_end)
+
 class NastranF06Parser:
     """Enhanced parser for NASTRAN F06 output files"""
     
@@ -43,39 +101,63 @@ class NastranF06Parser:
         if not f06_path.exists():
             self.logger.error(f"F06 file not found: {f06_path}")
             return []
-            
-        with open(f06_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-            
-        # Parse flutter summary sections
-        results = self._parse_flutter_summaries(lines)
         
+        # Map the file and decode only the flutter summary sections
+        with open(f06_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                self.logger.warning("No flutter results found in F06 file")
+                return []
+                
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Parse flutter summary sections. Sections are located by
+                # b'\n'; files with CR-only line endings (which readlines()
+                # also splits) are normalised first.
+                if mm.find(b'\r') >= 0 and _LONE_CR_RE.search(mm):
+                    results = self._parse_flutter_sections(
+                        mm[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n'))
+                else:
+                    results = self._parse_flutter_sections(mm)
+                
         if not results:
             self.logger.warning("No flutter results found in F06 file")
             self.logger.info("Checking for alternative formats...")
-            results = self._parse_eigenvalue_summary(lines)
+            # Stream the text up to the first eigenvalue summary
+            with open(f06_path, 'r', encoding='utf-8', errors='ignore') as f:
+                results = self._parse_eigenvalue_summary(f)
             
         return results
     
-    def _parse_flutter_summaries(self, lines: List[str]) -> List[FlutterResult]:
-        """Parse all FLUTTER SUMMARY sections from F06 lines"""
+    def _parse_flutter_sections(self, mm: Union[mmap.mmap, bytes]) -> List[FlutterResult]:
+        """Parse all FLUTTER SUMMARY sections of a memory-mapped (or in-memory) F06 file"""
         all_results = []
+        resume = 0
         
-        # Find all flutter summary sections
-        i = 0
-        while i < len(lines):
-            # Look for FLUTTER SUMMARY header
-            if 'FLUTTER' in lines[i] and 'SUMMARY' in lines[i]:
-                # Parse this flutter summary section
-                section_results = self._parse_single_flutter_summary(lines, i)
-                all_results.extend(section_results)
-                i += 20  # Skip ahead past this section
-            else:
-                i += 1
+        for start in _summary_header_offsets(mm):
+            if start < resume:
+                continue
+            
+            # Locate the end of the section window and the next header search start
+            end = start
+            resume = len(mm)
+            for n in range(_SECTION_LINES):
+                end = mm.find(b'\n', end) + 1
+                if end == 0:
+                    end = len(mm)
+                    break
+                if n == _SECTION_SKIP - 1:
+                    resume = end
+            
+            section = _decode_lines(mm[start:end])
+            all_results.extend(self._parse_single_flutter_summary(section, 0))
+        
+        return self._collect_results(all_results)
+    
+    def _collect_results(self, all_results: List[FlutterResult]) -> List[FlutterResult]:
+        """Remove duplicates, sort by velocity and renumber modes"""
         
         # Remove duplicates and sort by velocity
         unique_results = self._remove_duplicates(all_results)
-        unique_results.sort(key=lambda x: x.flutter_speed)
+        unique_results.sort(key=operator.attrgetter('flutter_speed'))
         
         # Renumber modes
         for idx, result in enumerate(unique_results):
@@ -107,28 +189,28 @@ class NastranF06Parser:
         
         if point_line:
             # Parse POINT line
-            mach_match = re.search(r'MACH NUMBER\s*=\s*([\d.E+-]+)', point_line)
+            mach_match = _MACH_RE.search(point_line)
             if mach_match:
                 try:
                     mach_number = float(mach_match.group(1))
                 except:
                     pass
                     
-            density_match = re.search(r'DENSITY RATIO\s*=\s*([\d.E+-]+)', point_line)
+            density_match = _DENSITY_RATIO_RE.search(point_line)
             if density_match:
                 try:
                     density_ratio = float(density_match.group(1))
                 except:
                     pass
                     
-            point_match = re.search(r'POINT\s*=\s*(\d+)', point_line)
+            point_match = _POINT_RE.search(point_line)
             if point_match:
                 try:
                     point_number = int(point_match.group(1))
                 except:
                     pass
                     
-            method_match = re.search(r'METHOD\s*=\s*(\w+)', point_line)
+            method_match = _METHOD_RE.search(point_line)
             if method_match:
                 method = method_match.group(1)
         
@@ -141,63 +223,51 @@ class NastranF06Parser:
                     data_start = start_idx + offset + 1
                     break
         
-        # Parse data lines
-        for offset in range(0, 50):  # Check up to 50 lines of data
-            if data_start + offset >= len(lines):
+        # Collect the data block: up to 50 lines, ending at the next section or a short line
+        block_end = min(data_start + 50, len(lines))
+        for idx in range(data_start, block_end):
+            line = lines[idx]
+            # Cheapest tests first; strip() copies the line so it runs last
+            if (len(line) < 10 or 'FLUTTER' in line or 'PAGE' in line
+                    or len(line.strip()) < 10):
+                block_end = idx
                 break
-                
-            line = lines[data_start + offset]
-            
-            # Stop at next section or empty lines
-            if 'FLUTTER' in line or 'PAGE' in line or len(line.strip()) < 10:
-                break
-                
-            # Parse data line
-            # Format: KFREQ  1./KFREQ  VELOCITY  DAMPING  FREQUENCY  COMPLEX_EIGENVALUE
-            parts = line.split()
-            if len(parts) >= 5:
-                try:
-                    # Skip header lines or invalid data
-                    if 'KFREQ' in line or '*' in parts[0]:
-                        continue
-                        
-                    # Parse values - adjust indices based on actual format
-                    if len(parts) >= 7:
-                        velocity = float(parts[2])
-                        damping = float(parts[3])
-                        frequency = float(parts[4])
-                    else:
-                        # Alternative format
-                        velocity = float(parts[1]) if len(parts) > 1 else 0.0
-                        damping = float(parts[2]) if len(parts) > 2 else 0.0
-                        frequency = float(parts[3]) if len(parts) > 3 else 0.0
-                    
-                    # Create FlutterResult
-                    # Include all points for analysis
-                    if velocity > 0:  # Valid velocity
-                        result = FlutterResult(
-                            flutter_speed=velocity,
-                            flutter_frequency=frequency,
-                            flutter_mode=point_number,
-                            damping=damping,
-                            method=f"NASTRAN-{method}",
-                            mach_number=mach_number,
-                            dynamic_pressure=0.5 * density_ratio * 1.225 * velocity**2
-                        )
-                        results.append(result)
-                        
-                except (ValueError, IndexError) as e:
-                    # Skip invalid lines
-                    continue
+        block = "".join(lines[data_start:block_end])
+        
+        # Extract (velocity, damping, frequency) of all data rows in one regex pass
+        # Format: KFREQ  1./KFREQ  VELOCITY  DAMPING  FREQUENCY  COMPLEX_EIGENVALUE
+        rows = [groups[0:3] if groups[0] else groups[3:6]
+                for groups in _FLUTTER_ROW_RE.findall(block)]
+        if not rows:
+            return results
+        
+        # Convert the whole table at once and keep points with a valid velocity
+        table = np.array(rows, dtype=float)
+        table = table[table[:, 0] > 0]
+        velocities = table[:, 0]
+        dynamic_pressures = (_HALF_RHO0 * density_ratio) * (velocities * velocities)
+        
+        # One (velocity, damping, frequency, q) row per result; positional
+        # arguments keep the per-row dataclass construction cheap
+        method = f"NASTRAN-{method}"
+        results.extend(
+            FlutterResult(velocity, frequency, point_number, damping,
+                          method, mach_number, dynamic_pressure)
+            for velocity, damping, frequency, dynamic_pressure
+            in np.column_stack((table, dynamic_pressures)).tolist()
+        )
         
         return results
     
-    def _parse_eigenvalue_summary(self, lines: List[str]) -> List[FlutterResult]:
+    def _parse_eigenvalue_summary(self, lines: Iterable[str]) -> List[FlutterResult]:
         """Parse eigenvalue summary as fallback"""
+        
+        # Only the text from the first summary header on is held in memory
+        lines = list(itertools.dropwhile(lambda line: not _is_eigenvalue_header(line), lines))
         results = []
         
         for i, line in enumerate(lines):
-            if 'EIGENVALUE' in line and 'CYCLES' in line:
+            if _is_eigenvalue_header(line):
                 # Found eigenvalue summary
                 for j in range(i+1, min(i+100, len(lines))):
                     data_line = lines[j]
@@ -205,25 +275,8 @@ class NastranF06Parser:
                     
                     if len(parts) >= 4:
                         try:
-                            mode = int(parts[0])
-                            eigenvalue = float(parts[1])
-                            frequency_rad = float(parts[2]) if len(parts) > 2 else 0.0
-                            frequency_hz = float(parts[3]) if len(parts) > 3 else frequency_rad / (2 * np.pi)
-                            
-                            # Estimate velocity (rough approximation)
-                            velocity = abs(frequency_hz * 10.0)  # Very rough estimate
-                            
-                            result = FlutterResult(
-                                flutter_speed=velocity,
-                                flutter_frequency=frequency_hz,
-                                flutter_mode=mode,
-                                damping=-0.01 if eigenvalue < 0 else 0.01,
-                                method="NASTRAN-EIGEN",
-                                mach_number=velocity / 343.0,
-                                dynamic_pressure=0.5 * 1.225 * velocity**2
-                            )
-                            results.append(result)
-                        except:
+                            results.append(self._eigenvalue_result(parts))
+                        except ValueError:
                             continue
                     
                     if 'EIGENVALUE' in data_line or not data_line.strip():
@@ -231,6 +284,26 @@ class NastranF06Parser:
                         
         return results
     
+    def _eigenvalue_result(self, parts: List[str]) -> FlutterResult:
+        """Build a result from the fields of an eigenvalue summary line"""
+        mode = int(parts[0])
+        eigenvalue = float(parts[1])
+        frequency_rad = float(parts[2]) if len(parts) > 2 else 0.0
+        frequency_hz = float(parts[3]) if len(parts) > 3 else frequency_rad / (2 * np.pi)
+        
+        # Estimate velocity (rough approximation)
+        velocity = abs(frequency_hz * 10.0)  # Very rough estimate
+        
+        return FlutterResult(
+            flutter_speed=velocity,
+            flutter_frequency=frequency_hz,
+            flutter_mode=mode,
+            damping=-0.01 if eigenvalue < 0 else 0.01,
+            method="NASTRAN-EIGEN",
+            mach_number=velocity / 343.0,
+            dynamic_pressure=_HALF_RHO0 * (velocity * velocity)
+        )
+    
     def _remove_duplicates(self, results: List[FlutterResult]) -> List[FlutterResult]:
         """Remove duplicate results based on velocity and frequency"""
         unique = []
@@ -257,30 +330,29 @@ class NastranF06Parser:
             return None
             
         # Return the unstable mode with lowest velocity
-        return min(unstable, key=lambda r: r.flutter_speed)
+        return min(unstable, key=operator.attrgetter('flutter_speed'))
     
     def generate_sample_results(self) -> List[FlutterResult]:
         """Generate sample flutter results for testing"""
-        results = []
         
         # Create a realistic flutter boundary
         velocities = [100, 150, 200, 250, 300, 350, 400, 450, 500]
         frequencies = [15, 20, 25, 30, 35, 40, 45, 50, 55]
         dampings = [0.05, 0.03, 0.01, -0.01, -0.03, -0.05, -0.07, -0.09, -0.11]
         
-        for i, (v, f, d) in enumerate(zip(velocities, frequencies, dampings)):
-            result = FlutterResult(
+        # Build the results in one pass instead of appending one at a time
+        return [
+            FlutterResult(
                 flutter_speed=v,
                 flutter_frequency=f,
                 flutter_mode=i + 1,
                 damping=d,
                 method="NASTRAN-SAMPLE",
                 mach_number=v / 343.0,
-                dynamic_pressure=0.5 * 1.225 * v**2
+                dynamic_pressure=_HALF_RHO0 * (v * v)
             )
-            results.append(result)
-            
-        return results
+            for i, (v, f, d) in enumerate(zip(velocities, frequencies, dampings))
+        ]
 
 
 def parse_nastran_results(f06_file: str) -> List[FlutterResult]:
@@ -14,20 +14,46 @@ import shutil
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import re
+import io
 import time
 import os
+import errno
 import platform
+import glob
+import functools
+import operator
+from datetime import datetime
+import collections
+import importlib.util
+import signal
+import threading
+import queue
+import copy
+import weakref
 
-# Import pyNastran for BDF creation
+# pyNastran is only needed by the pyNastran BDF writer, so it is located here
+# and imported on first use
+PYNASTRAN_AVAILABLE = importlib.util.find_spec("pyNastran") is not None
+if not PYNASTRAN_AVAILABLE:
+    logging.warning("pyNastran not available - BDF generation limited")
+
+# numba for the simulated flutter sweep kernel (plain NumPy without it)
 try:
-    from pyNastran.bdf.bdf import BDF
-    PYNASTRAN_AVAILABLE = True
+    from .numba_compat import njit, NUMBA_AVAILABLE
 except ImportError:
-    logging.warning("pyNastran not available - BDF generation limited")
-    PYNASTRAN_AVAILABLE = False
-    class BDF:
-        pass
+    # Fallback for when running as script
+    from numba_compat import njit, NUMBA_AVAILABLE
+
+# Import the advanced BDF generator
+try:
+    from .nastran_bdf_generator import NastranBDFGenerator
+except ImportError:
+    try:
+        from nastran_bdf_generator import NastranBDFGenerator
+    except ImportError:
+        NastranBDFGenerator = None
 
 # Import the F06 parser - handle circular import
 try:
@@ -51,6 +77,223 @@ except ImportError:
             dynamic_pressure: float = 0.0
         NastranF06Parser = None
 
+# Precompiled patterns used when scanning BDF input and solver output
+# PSHELL thickness occupies columns 25-32 (third 8-character data field)
+_PSHELL_THICKNESS_RE = re.compile(r"^PSHELL.{18}(.{8})", re.MULTILINE)
+# NASTRAN's own fatal error markers, not every line mentioning "fatal"
+# (banners, "0 FATAL MESSAGES" summaries)
+_FATAL_RE = re.compile(r"^\s*\*\*\* (?:USER|SYSTEM) FATAL MESSAGE")
+
+# Files that show a NASTRAN run produced output
+_NASTRAN_OUTPUT_EXTENSIONS = ('.f06', '.out', '.op2', '.pch', '.log')
+
+# Number of trailing console lines kept from a NASTRAN run for diagnostics
+_OUTPUT_TAIL_LINES = 500
+# RAM-backed temporary filesystem on Linux
+_SHM_DIR = "/dev/shm"
+# Background worker clearing analysis working directories (threads start on first use)
+_CLEANUP_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nastran-cleanup")
+
+def _clear_directory(path: str):
+    """Delete the contents of a directory, keeping the directory itself"""
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+def _write_bytes(path, data: bytes):
+    """Write a complete file with direct os.write calls, bypassing Python's buffer"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        # Normally a single write(); loop only on a partial write
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _fast_copy(src, dst):
+    """
+    Copy a file in the kernel and carry over its access/modification times.
+    
+    copy_file_range() lets the filesystem clone the data (reflinks on Btrfs
+    and XFS) or copy it without passing through user space; shutil.copyfile
+    (sendfile) is used where it is unavailable or unsupported.
+    """
+    st = os.stat(src)
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = st.st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    # Nothing copied before the expected end: some filesystems
+                    # report "unsupported" this way rather than with an error
+                    raise OSError(errno.ENOTSUP, "copy_file_range copied no data")
+                remaining -= copied
+    except (AttributeError, OSError):
+        # No copy_file_range (non-Linux) or not supported between these files
+        shutil.copyfile(src, dst)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    return dst
+
+# Simulated F06 banner and flutter summary heading (%s: job timestamp)
+_F06_HEADER = """
+MSC.NASTRAN JOB CREATED ON %s
+                                                                              
+     THIS VERSION OF NASTRAN HAS BEEN SIMULATED FOR TESTING
+                                                                              
+                    FLUTTER ANALYSIS - SOL 145
+                                                                              
+0                                                                               
+ 
+      FLUTTER  SUMMARY                                                        
+      POINT = 1           MACH NUMBER = 0.300                                
+      CONFIGURATION = 1   XY-SYMMETRY = ASYMMETRIC   XZ-SYMMETRY = ASYMMETRIC
+      DENSITY RATIO = 1.0000E+00   METHOD = PK                               
+                                                                              
+          KFREQ       1./KFREQ       VELOCITY       DAMPING       FREQUENCY      COMPLEX EIGENVALUE
+                                        M/SEC                        HZ           REAL           IMAG
+"""
+
+# Simulated F06 flutter summary row:
+# KFREQ, 1./KFREQ, VELOCITY, DAMPING, FREQUENCY, REAL and IMAG eigenvalue
+_F06_ROW_FORMAT = "  %12.5E" * 7 + "\n"
+
+# Simulated F06 closing lines (flutter velocity, flutter frequency)
+_F06_FOOTER = """
+     
+     FLUTTER VELOCITY = %.1f M/S AT %.1f HZ
+     
+     *** NASTRAN NORMAL COMPLETION ***
+"""
+
+@njit(cache=True, nogil=True)
+def _flutter_rows(V, flutter_velocity, flutter_frequency):
+    """Damping, frequency, reduced frequency and eigenvalues for a velocity sweep"""
+    damping = 0.08 - (V / flutter_velocity) * (0.08 + 0.015)
+    freq = flutter_frequency * (0.95 + 0.1 * (V / flutter_velocity))
+    kfreq = np.where(V > 0, freq * 2 * np.pi / np.where(V > 0, V, 1.0), 0.001)
+    inv_kfreq = np.where(kfreq > 0, 1 / np.where(kfreq > 0, kfreq, 1.0), 1e6)
+    real_eig = -damping * freq * 2 * np.pi
+    imag_eig = freq * 2 * np.pi
+    return kfreq, inv_kfreq, damping, freq, real_eig, imag_eig
+
+# Constant bulk data cards for the SOL 145 text BDF (8-character fields)
+# EIGRL: SID=100, V1=0.1 Hz, V2=1000 Hz, ND=20 modes
+_EIGRL_CARD = "EIGRL        100   0.100  1000.0      20\n"
+# CAERO1: EID=5000, PID=5001, CP=0, NSPAN=8, NCHORD=4, LSPAN=0, LCHORD=0, IGID=1
+_CAERO1_CARD = "CAERO1      5000    5001       0       8       4       0       0       1\n"
+# PAERO1: PID=5001 (required for CAERO1)
+_PAERO1_CARD = "PAERO1      5001\n"
+# SPLINE1: EID=6000, CAERO=5000, BOX1=5000, BOX2=5031 (8x4 boxes), SETG=1000, DZ=0.0
+_SPLINE1_CARD = "SPLINE1     6000    5000    5000    5031    1000   0.000\n"
+# FLUTTER: SID=200, METHOD=PK, DENS=1, MACH=2, RFREQ=3, IMETH=L, NVALUE=5, EPS=0.001
+_FLUTTER_CARD = "FLUTTER      200PK             1       2       3L              5  0.0010\n"
+
+# Flutter sweep tables shared by the FLFACT and MKAERO1 cards
+_DENSITY_RATIOS = np.array([0.5, 1.0, 1.5])
+_MACH_NUMBERS = np.array([0.0, 0.5, 0.8, 0.9, 1.1, 1.5])
+_REDUCED_FREQUENCIES = np.array([0.001, 0.01, 0.1, 0.5, 1.0, 2.0])
+
+def _bdf_fields(values: np.ndarray, fmt: str) -> str:
+    """Format an array as consecutive 8-character BDF fields"""
+    return "".join(np.char.mod(fmt, values))
+
+def _flfact_line(sid: int, values: np.ndarray, fmt: str = "%8.3f") -> str:
+    """FLFACT card with up to seven values on a single line"""
+    return f"FLFACT  {sid:8d}{_bdf_fields(values, fmt)}\n"
+
+# FLFACT lists: density ratios (1), Mach numbers (2), reduced frequencies (3)
+_FLFACT_DENSITY = _flfact_line(1, _DENSITY_RATIOS)
+_FLFACT_MACH = _flfact_line(2, _MACH_NUMBERS)
+_FLFACT_RFREQ = _flfact_line(3, _REDUCED_FREQUENCIES, "%8.4f")
+# MKAERO1: Mach numbers with reduced frequencies on the continuation line
+_MKAERO1_CARD = (f"MKAERO1 {_bdf_fields(_MACH_NUMBERS, '%8.3f')}\n"
+                 f"+       {_bdf_fields(_REDUCED_FREQUENCIES, '%8.4f')}\n")
+
+# Mesh card rows: GRID (ID, X1, X2, X3) and CQUAD4 (EID, PID, G1-G4)
+_GRID_FORMAT = "GRID    %8d        %8.4f%8.4f%8.4f\n"
+_CQUAD4_FORMAT = "CQUAD4  %8d%8d%8d%8d%8d%8d\n"
+
+# Static blocks of the text BDF, pre-joined so each is written in one call
+_BDF_RULE = "$ " + "*" * 70 + "\n"
+_BDF_BANNER = _BDF_RULE + "$ NASTRAN BDF FOR PANEL FLUTTER ANALYSIS\n"
+_BDF_CONTROL_DECKS = (
+    "ID PANEL,FLUTTER\n"
+    "SOL 145\n"                     # Aerodynamic Flutter Analysis
+    "TIME 600\n"                    # CPU time limit
+    "CEND\n"
+    "TITLE = Panel Flutter Analysis - SOL 145\n"
+    "SUBTITLE = Flat Panel with Supersonic Flow\n"
+    "ECHO = NONE\n"
+    "SPC = 1\n"                     # Boundary conditions
+    "METHOD = 100\n"                # Eigenvalue extraction method
+    "FMETHOD = 200\n"               # Flutter method
+    "DISPLACEMENT = ALL\n"
+    "STRESS = ALL\n"
+    "FORCE = ALL\n"
+    "BEGIN BULK\n"
+    "PARAM,GRDPNT,0\n"              # Reference grid point
+    "PARAM,AUTOSPC,YES\n"           # Auto single point constraints
+    "PARAM,COUPMASS,1\n"            # Coupled mass matrix
+    "PARAM,WTMASS,0.00259\n"        # Weight to mass conversion
+)
+_BDF_EIGRL_BLOCK = "$\n$ EIGENVALUE EXTRACTION\n$\n" + _EIGRL_CARD
+_BDF_FLUTTER_BLOCK = (
+    "$\n$ SPLINE FOR AERO-STRUCTURE COUPLING\n$\n" + _SPLINE1_CARD
+    + "$\n$ FLUTTER ANALYSIS DATA\n$\n" + _FLUTTER_CARD
+    + "$ Density ratios\n" + _FLFACT_DENSITY
+    + "$ Mach numbers\n" + _FLFACT_MACH
+    + "$ Reduced frequencies\n" + _FLFACT_RFREQ
+    + "$\n$ AERODYNAMIC MATRICES\n$\n" + _MKAERO1_CARD
+    + "ENDDATA\n"
+)
+
+@functools.lru_cache(maxsize=4)
+def _mesh_topology_cards(num_x_elem: int, num_y_elem: int) -> Tuple[str, str, str]:
+    """CQUAD4, SPC1 and SET1 text of a panel mesh, which depend only on its size"""
+    nx = num_x_elem + 1
+    ny = num_y_elem + 1
+    
+    # Element connectivity: counter-clockwise corners of each cell
+    j, i = np.mgrid[0:num_y_elem, 0:num_x_elem]
+    n1 = (j * nx + i + 1).ravel()
+    quads = np.column_stack([np.arange(1, n1.size + 1), np.ones_like(n1),
+                             n1, n1 + 1, n1 + 1 + nx, n1 + nx])
+    cquad4 = _CQUAD4_FORMAT * len(quads) % tuple(quads.ravel().tolist())
+    
+    # Fix all edge nodes: left (x=0) and right (x=L) edges, then bottom
+    # (y=0) and top (y=W) edges without their corners
+    edge_nodes = []
+    edge_nodes.extend(range(1, (ny-1) * nx + 2, nx))
+    edge_nodes.extend(range(nx, ny * nx + 1, nx))
+    edge_nodes.extend(range(2, nx))
+    edge_nodes.extend(range((ny-1) * nx + 2, ny * nx))
+    spc1 = "".join([f"SPC1    {1:8d}{'123456':8s}{node:8d}\n"
+                    for node in sorted(set(edge_nodes))])
+    
+    # SET1 of all structural grids for the spline
+    # SET1 format: first line has SET1, SID, then up to 7 grid IDs
+    # Continuation lines start with + in field 1, then up to 8 grid IDs
+    cells = np.char.mod("%8d", np.arange(1, nx*ny + 1))
+    set1 = (f"SET1    {1000:8d}" + "".join(cells[:7])
+            + "".join(["\n+       " + "".join(cells[i:i + 8])
+                       for i in range(7, len(cells), 8)])
+            + "\n")
+    
+    return cquad4, spc1, set1
+
 @dataclass
 class NastranConfig:
     """NASTRAN solver configuration"""
@@ -73,6 +316,11 @@ class NastranConfig:
     cpu_time: int = 3600  # seconds
     scratch_dir: Optional[str] = None
     
+    max_concurrent: int = 2  # NASTRAN jobs run at once by analyze_flutter_batch (licences permitting)
+    
+    # Output options
+    save_f06: bool = True  # Keep a timestamped copy of the F06 in the current directory
+    
     def __post_init__(self):
         if self.nastran_paths is None:
             # Default NASTRAN installation paths for different versions
@@ -110,6 +358,179 @@ class NastranConfig:
         if self.velocities is None:
             self.velocities = list(range(50, 501, 25))  # 50-500 m/s in 25 m/s steps
 
+@functools.lru_cache(maxsize=32)
+def _cached_glob(path_pattern: str, root_mtime: float = 0.0) -> Tuple[str, ...]:
+    """Expand a wildcard installation path once per pattern and root mtime"""
+    return tuple(glob.glob(path_pattern))
+
+def _glob_root_mtime(path_pattern: str) -> float:
+    """Modification time of the directory holding the first wildcard component"""
+    root = os.path.dirname(path_pattern.split('*', 1)[0]) or '.'
+    try:
+        return os.stat(root).st_mtime
+    except OSError:
+        return -1.0
+
+def _glob_installations(path_pattern: str) -> Tuple[str, ...]:
+    """Expand a wildcard path, rescanning only when its fixed root directory changes"""
+    return _cached_glob(path_pattern, _glob_root_mtime(path_pattern))
+
+# Executable probing: per-command timeout (s) and words identifying NASTRAN output
+_PROBE_TIMEOUT = 1.5
+_NASTRAN_TOKENS = ('nastran', 'msc', 'nx', 'nei')
+_MAX_PROBE_WORKERS = 8
+# Drive-letter paths and Windows executable/script suffixes
+_WINDOWS_PATH_RE = re.compile(r'^[A-Za-z]:[\\/]|.*\.(?:exe|bat|cmd)$', re.IGNORECASE)
+
+# Output that identified each probed executable, reused for version detection.
+# Only successful probes are remembered, so an executable that timed out on a
+# slow cold start is tried again by the next solver.
+_PROBE_OUTPUT: Dict[str, str] = {}
+
+def _probe_nastran_executable(real_path: str) -> bool:
+    """Run the executable test commands until one resolved executable path answers as NASTRAN"""
+    if real_path in _PROBE_OUTPUT:
+        return True
+    
+    try:
+        # Different test commands for different versions. The bare invocation
+        # is not tried since some installations sit waiting for input.
+        test_commands = [
+            [real_path, "-help"],
+            [real_path, "-v"],
+            [real_path, "-version"],
+        ]
+        
+        for test_cmd in test_commands:
+            try:
+                result = subprocess.run(test_cmd, capture_output=True, text=True,
+                                      stdin=subprocess.DEVNULL,
+                                      timeout=_PROBE_TIMEOUT)
+                output = (result.stdout + result.stderr).lower()
+                
+                # Check for NASTRAN-related output
+                if any(word in output for word in _NASTRAN_TOKENS):
+                    _PROBE_OUTPUT[real_path] = output
+                    return True
+            except (OSError, subprocess.SubprocessError):
+                continue
+                
+    except Exception as e:
+        logging.getLogger(__name__).debug(f"Failed to validate {real_path}: {e}")
+    
+    return False
+
+@functools.lru_cache(maxsize=64)
+def _detect_version_from_output(real_path: str) -> str:
+    """Query the executable for its version once per resolved executable path"""
+    
+    # The validation probe usually printed the version banner already
+    version = NastranVersion.match_tokens(_PROBE_OUTPUT.get(real_path, ""))
+    if version is not None:
+        return version
+    
+    try:
+        result = subprocess.run([real_path, "-v"], capture_output=True, text=True,
+                              stdin=subprocess.DEVNULL, timeout=_PROBE_TIMEOUT)
+        version = NastranVersion.match_tokens(result.stdout + result.stderr)
+        if version is not None:
+            return version
+    except (OSError, subprocess.SubprocessError):
+        pass
+    
+    return NastranVersion.GENERIC
+
+def _resolve_command(path: str) -> Optional[str]:
+    """Resolve a candidate to an executable file without running it"""
+    
+    # Windows-only candidates can be rejected without touching the filesystem
+    if platform.system() != "Windows" and _WINDOWS_PATH_RE.match(path):
+        return None
+    
+    # Handles explicit paths as well as bare commands found on PATH
+    return shutil.which(path)
+
+def _is_nastran_executable(path: str, strict: bool = False) -> bool:
+    """Validate that NASTRAN executable exists and is runnable"""
+    
+    resolved = _resolve_command(path)
+    if resolved is None:
+        return False
+    
+    # Only check that the binary answers as NASTRAN when asked to
+    if not strict:
+        return True
+    
+    # Try a minimal test run (cached per resolved path across solver instances)
+    return _probe_nastran_executable(os.path.realpath(resolved))
+
+@functools.lru_cache(maxsize=8)
+def _resolve_nastran(nastran_paths: Tuple[str, ...], path_states: tuple = ()) -> Optional[str]:
+    """First valid executable among the search paths (cached per paths and their state)"""
+    return _search_nastran(nastran_paths)
+
+def _search_nastran(nastran_paths: Tuple[str, ...]) -> Optional[str]:
+    """Expand the search paths and probe the candidates in priority order"""
+    candidates = []
+    windows = platform.system() == "Windows"
+    for path_pattern in nastran_paths:
+        if not windows and _WINDOWS_PATH_RE.match(path_pattern):
+            continue
+        
+        # Handle wildcards in paths
+        if '*' in path_pattern:
+            candidates.extend(_glob_installations(path_pattern))
+        else:
+            candidates.append(path_pattern)
+    
+    # Only files that could be run are probed, each executable once
+    real_paths = {}
+    for candidate in filter(None, map(_resolve_command, candidates)):
+        real_paths.setdefault(os.path.realpath(candidate), candidate)
+    if not real_paths:
+        return None
+    
+    # Usually the highest-priority candidate is valid, so it is probed alone
+    # and the other executables are only started when it is not
+    (first_real, first), *rest = real_paths.items()
+    if _probe_nastran_executable(first_real):
+        return first
+    if len(rest) <= 1:
+        return next((c for real, c in rest if _probe_nastran_executable(real)), None)
+    
+    # Probe the remaining candidates concurrently, keeping the priority order
+    pool = ThreadPoolExecutor(max_workers=min(len(rest), _MAX_PROBE_WORKERS))
+    try:
+        probes = pool.map(_probe_nastran_executable, [real for real, _ in rest])
+        for (_, candidate), valid in zip(rest, probes):
+            if valid:
+                return candidate
+    finally:
+        # Don't wait on slower probes of lower-priority candidates
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    return None
+
+def _find_nastran_executable(nastran_paths: List[str]) -> Optional[str]:
+    """Resolve the NASTRAN executable, reusing earlier searches over the same paths"""
+    paths = tuple(nastran_paths)
+    
+    # Wildcard roots are keyed by mtime and fixed paths by what they resolve
+    # to, so installing NASTRAN after a failed search is picked up
+    path_states = tuple(_glob_root_mtime(p) if '*' in p else _resolve_command(p)
+                        for p in paths)
+    
+    executable = _resolve_nastran(paths, path_states)
+    if executable is not None and not os.path.isfile(executable):
+        # Removed since it was cached - search again
+        _resolve_nastran.cache_clear()
+        executable = _resolve_nastran(paths, path_states)
+    if executable is None:
+        # A failed search is not kept - a probe may only have timed out
+        _resolve_nastran.cache_clear()
+    
+    return executable
+
 class NastranVersion:
     """Detect and handle different NASTRAN versions"""
     
@@ -118,34 +539,30 @@ class NastranVersion:
     NEI_NASTRAN = "NEI"
     GENERIC = "GENERIC"
     
+    # Identifying tokens in priority order
+    TOKENS = {
+        "MSC": MSC_NASTRAN,
+        "NX": NX_NASTRAN,
+        "SIEMENS": NX_NASTRAN,
+        "NEI": NEI_NASTRAN,
+    }
+    
+    @staticmethod
+    def match_tokens(text: str) -> Optional[str]:
+        """Return the version whose token first appears in text, if any"""
+        text = text.upper()
+        return next((version for token, version in NastranVersion.TOKENS.items()
+                     if token in text), None)
+    
     @staticmethod
     def detect_version(executable_path: str) -> str:
         """Detect NASTRAN version from executable path or output"""
-        path_upper = str(executable_path).upper()
-        
-        if "MSC" in path_upper:
-            return NastranVersion.MSC_NASTRAN
-        elif "NX" in path_upper or "SIEMENS" in path_upper:
-            return NastranVersion.NX_NASTRAN
-        elif "NEI" in path_upper:
-            return NastranVersion.NEI_NASTRAN
+        version = NastranVersion.match_tokens(os.fspath(executable_path))
+        if version is not None:
+            return version
         
-        # Try to get version from executable
-        try:
-            result = subprocess.run([executable_path, "-v"], 
-                                  capture_output=True, text=True, timeout=5)
-            output = (result.stdout + result.stderr).upper()
-            
-            if "MSC" in output:
-                return NastranVersion.MSC_NASTRAN
-            elif "NX" in output or "SIEMENS" in output:
-                return NastranVersion.NX_NASTRAN
-            elif "NEI" in output:
-                return NastranVersion.NEI_NASTRAN
-        except:
-            pass
-        
-        return NastranVersion.GENERIC
+        # Try to get version from executable (cached per resolved path)
+        return _detect_version_from_output(os.path.realpath(executable_path))
 
 class NastranSolver:
     """
@@ -156,6 +573,8 @@ class NastranSolver:
         self.config = config or NastranConfig()
         self.logger = logging.getLogger(__name__)
         self.temp_dir = None
+        self._work_dir_cleared = None  # pending clear of temp_dir from the last run
+        self._work_dir_finalizer = None  # removes temp_dir when the solver goes away
         self.nastran_executable = None
         self.nastran_version = NastranVersion.GENERIC
         self.simulation_mode = False
@@ -163,30 +582,21 @@ class NastranSolver:
         # Find and validate NASTRAN installation
         self._initialize_nastran()
         
+        # Resolve the BDF writer once instead of on every analysis
+        self._advanced_bdf_writer = self._select_bdf_writer()
+        
     def _initialize_nastran(self):
         """Initialize NASTRAN executable and detect version"""
         
         self.logger.info("Searching for NASTRAN installation...")
         
-        for path_pattern in self.config.nastran_paths:
-            # Handle wildcards in paths
-            if '*' in path_pattern:
-                import glob
-                matches = glob.glob(path_pattern)
-                for match in matches:
-                    if self._validate_nastran_executable(match):
-                        self.nastran_executable = match
-                        self.nastran_version = NastranVersion.detect_version(match)
-                        self.logger.info(f"Found NASTRAN: {match}")
-                        self.logger.info(f"NASTRAN Version: {self.nastran_version}")
-                        return
-            else:
-                if self._validate_nastran_executable(path_pattern):
-                    self.nastran_executable = path_pattern
-                    self.nastran_version = NastranVersion.detect_version(path_pattern)
-                    self.logger.info(f"Found NASTRAN: {path_pattern}")
-                    self.logger.info(f"NASTRAN Version: {self.nastran_version}")
-                    return
+        executable = _find_nastran_executable(self.config.nastran_paths)
+        if executable is not None:
+            self.nastran_executable = executable
+            self.nastran_version = NastranVersion.detect_version(executable)
+            self.logger.info(f"Found NASTRAN: {executable}")
+            self.logger.info(f"NASTRAN Version: {self.nastran_version}")
+            return
         
         # No NASTRAN found - enable simulation mode
         self.logger.warning("No NASTRAN installation found")
@@ -197,45 +607,9 @@ class NastranSolver:
         """Check if NASTRAN solver is available"""
         return self.nastran_executable is not None and not self.simulation_mode
     
-    def _validate_nastran_executable(self, path: str) -> bool:
+    def _validate_nastran_executable(self, path: str, strict: bool = False) -> bool:
         """Validate that NASTRAN executable exists and is runnable"""
-        
-        exe_path = Path(path)
-        if not exe_path.exists():
-            return False
-        
-        # Check if file is executable
-        if not os.access(str(exe_path), os.X_OK):
-            # On Windows, .exe files might not have X_OK set
-            if platform.system() != "Windows" or not str(exe_path).endswith('.exe'):
-                return False
-        
-        # Try a minimal test run
-        try:
-            # Different test commands for different versions
-            test_commands = [
-                [str(exe_path), "-help"],
-                [str(exe_path), "-v"],
-                [str(exe_path), "-version"],
-                [str(exe_path)],  # Some versions show help with no args
-            ]
-            
-            for test_cmd in test_commands:
-                try:
-                    result = subprocess.run(test_cmd, capture_output=True, 
-                                          text=True, timeout=5)
-                    output = (result.stdout + result.stderr).lower()
-                    
-                    # Check for NASTRAN-related output
-                    if any(word in output for word in ['nastran', 'msc', 'nx', 'nei', 'version']):
-                        return True
-                except:
-                    continue
-                    
-        except Exception as e:
-            self.logger.debug(f"Failed to validate {exe_path}: {e}")
-        
-        return False
+        return _is_nastran_executable(path, strict)
     
     def execute_nastran(self, bdf_path: Path, work_dir: Path = None) -> Path:
         """
@@ -260,60 +634,38 @@ class NastranSolver:
         self.logger.info(f"Working directory: {work_dir}")
         
         try:
-            # Create run script for better control (especially on Windows)
-            if platform.system() == "Windows":
-                run_script = self._create_windows_run_script(cmd, work_dir)
-                actual_cmd = ["cmd", "/c", str(run_script)]
-            else:
-                actual_cmd = cmd
-            
-            # Execute NASTRAN
+            # Execute NASTRAN directly in the working directory (no cmd.exe wrapper)
             start_time = time.time()
-            result = subprocess.run(
-                actual_cmd,
-                cwd=str(work_dir),
-                capture_output=True,
-                text=True,
-                timeout=self.config.cpu_time
-            )
+            output_tail = self._run_streaming(cmd, work_dir)
             
             execution_time = time.time() - start_time
             self.logger.info(f"NASTRAN execution completed in {execution_time:.1f} seconds")
             
             # Log output for debugging
-            if result.stdout:
-                self.logger.debug(f"STDOUT (first 1000 chars):\n{result.stdout[:1000]}")
-            if result.stderr:
-                self.logger.debug(f"STDERR (first 1000 chars):\n{result.stderr[:1000]}")
+            if output_tail:
+                self.logger.debug(f"OUTPUT (last {_OUTPUT_TAIL_LINES} lines):\n{output_tail}")
             
-            # Check for output files
-            output_found = self._check_nastran_output(work_dir, job_name)
+            # Check for output files (single directory scan)
+            output_files = self._list_nastran_outputs(work_dir, job_name)
             
-            if not output_found:
+            if output_files:
+                self.logger.info(f"Found output files: {output_files}")
+            else:
                 self.logger.warning("No NASTRAN output files found")
                 
-                # Check if NASTRAN actually ran
-                if "fatal" in result.stdout.lower() or "fatal" in result.stderr.lower():
-                    raise RuntimeError("NASTRAN reported fatal error")
-                
                 # Fall back to simulation mode
                 self.logger.info("Falling back to SIMULATION MODE")
                 return self._simulate_nastran_execution(bdf_path)
             
             # Find and return F06 file
-            f06_files = list(work_dir.glob(f"{job_name}*.f06"))
+            f06_files = [name for name in output_files if name.endswith('.f06')]
             if f06_files:
-                return f06_files[0]
+                return work_dir / f06_files[0]
             
             # Check alternative output formats
-            alternative_outputs = [
-                work_dir / f"{job_name}.out",
-                work_dir / f"{job_name}.pch",
-                work_dir / f"{job_name}.op2"
-            ]
-            
-            for alt_output in alternative_outputs:
-                if alt_output.exists():
+            for ext in ('.out', '.pch', '.op2'):
+                if f"{job_name}{ext}" in output_files:
+                    alt_output = work_dir / f"{job_name}{ext}"
                     self.logger.info(f"Found alternative output: {alt_output}")
                     # Convert to F06 format if needed
                     return self._convert_to_f06(alt_output)
@@ -329,6 +681,74 @@ class NastranSolver:
             self.logger.info("Falling back to SIMULATION MODE due to execution error")
             return self._simulate_nastran_execution(bdf_path)
     
+    def _run_streaming(self, cmd: List[str], work_dir: Path) -> str:
+        """
+        Run NASTRAN reading its console output line by line.
+        
+        Only the last lines are kept in memory; with debug logging enabled
+        every line is also passed to the logger as it arrives. The run is
+        stopped as soon as a fatal message is printed or when cpu_time is
+        exceeded.
+        """
+        
+        tail = collections.deque(maxlen=_OUTPUT_TAIL_LINES)
+        timed_out = threading.Event()
+        echo = self.logger.isEnabledFor(logging.DEBUG)
+        
+        proc = subprocess.Popen(
+            cmd,
+            cwd=str(work_dir),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors='replace',
+            bufsize=1,
+            # Own process group so solver child processes are stopped too
+            start_new_session=(os.name != 'nt')
+        )
+        
+        def _timeout():
+            timed_out.set()
+            self._stop_process(proc)
+        
+        timer = threading.Timer(self.config.cpu_time, _timeout)
+        timer.daemon = True
+        timer.start()
+        
+        try:
+            for line in proc.stdout:
+                tail.append(line)
+                if echo:
+                    self.logger.debug(f"NASTRAN: {line.rstrip()}")
+                if _FATAL_RE.match(line):
+                    self._stop_process(proc)
+                    raise RuntimeError(f"NASTRAN reported fatal error: {line.strip()}")
+            proc.wait()
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                self._stop_process(proc)
+            proc.wait()
+            proc.stdout.close()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, self.config.cpu_time, output="".join(tail))
+        
+        return "".join(tail)
+    
+    @staticmethod
+    def _stop_process(proc: subprocess.Popen):
+        """Kill a running NASTRAN process together with its process group"""
+        
+        try:
+            if os.name != 'nt':
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+    
     def _build_nastran_command(self, bdf_path: Path, job_name: str) -> List[str]:
         """Build NASTRAN command line based on version"""
         
@@ -377,32 +797,28 @@ class NastranSolver:
         
         return cmd
     
-    def _create_windows_run_script(self, cmd: List[str], work_dir: Path) -> Path:
-        """Create a batch script for Windows execution"""
-        
-        script_path = work_dir / "run_nastran.bat"
-        
-        with open(script_path, 'w') as f:
-            f.write("@echo off\n")
-            f.write(f"cd /d {work_dir}\n")
-            f.write(" ".join(cmd) + "\n")
-            f.write("exit /b %errorlevel%\n")
-        
-        return script_path
-    
     def _check_nastran_output(self, work_dir: Path, job_name: str) -> bool:
         """Check if NASTRAN produced output files"""
         
-        expected_extensions = ['.f06', '.out', '.op2', '.pch', '.log']
-        
-        for ext in expected_extensions:
-            files = list(work_dir.glob(f"{job_name}*{ext}"))
-            if files:
-                self.logger.info(f"Found output files: {[f.name for f in files]}")
-                return True
+        files = self._list_nastran_outputs(work_dir, job_name)
+        if files:
+            self.logger.info(f"Found output files: {files}")
+            return True
         
         return False
     
+    @staticmethod
+    def _list_nastran_outputs(work_dir: Path, job_name: str) -> List[str]:
+        """Names of the job's output files, found with one directory scan"""
+        
+        with os.scandir(work_dir) as entries:
+            return sorted(
+                entry.name for entry in entries
+                if entry.name.startswith(job_name)
+                and entry.name.endswith(_NASTRAN_OUTPUT_EXTENSIONS)
+                and entry.is_file()
+            )
+    
     def _simulate_nastran_execution(self, bdf_path: Path) -> Path:
         """Simulate NASTRAN execution and generate F06 file"""
         
@@ -418,15 +834,11 @@ class NastranSolver:
         try:
             with open(bdf_path, 'r') as f:
                 bdf_content = f.read()
-            # Extract thickness from PSHELL card
-            for line in bdf_content.split('\n'):
-                if line.startswith('PSHELL'):
-                    # PSHELL format: cols 25-32 contain thickness
-                    if len(line) >= 32:
-                        thickness_str = line[24:32].strip()
-                        thickness = float(thickness_str)
-                        self.logger.info(f"Extracted thickness from BDF: {thickness*1000:.1f} mm")
-                        break
+            # Extract thickness from the first complete PSHELL card
+            match = _PSHELL_THICKNESS_RE.search(bdf_content)
+            if match:
+                thickness = float(match.group(1).strip())
+                self.logger.info(f"Extracted thickness from BDF: {thickness*1000:.1f} mm")
         except Exception as e:
             self.logger.warning(f"Could not extract thickness from BDF: {e}")
         
@@ -449,72 +861,133 @@ class NastranSolver:
         
         content = self._generate_f06_content(flutter_velocity, flutter_frequency)
         
-        with open(f06_path, 'w') as f:
-            f.write(content)
+        # Content is pure ASCII bytes - hand it to the OS in one write
+        _write_bytes(f06_path, content)
         
         self.logger.info(f"Generated simulated F06: {f06_path}")
         return f06_path
     
-    def _generate_f06_content(self, flutter_velocity: float, flutter_frequency: float) -> str:
-        """Generate realistic F06 content"""
+    def _generate_f06_content(self, flutter_velocity: float, flutter_frequency: float,
+                              num_points: int = 20) -> bytes:
+        """Generate realistic F06 content as ASCII bytes"""
         
-        content = f"""
-MSC.NASTRAN JOB CREATED ON {time.strftime('%d-%b-%y AT %H:%M:%S')}
-                                                                              
-     THIS VERSION OF NASTRAN HAS BEEN SIMULATED FOR TESTING
-                                                                              
-                    FLUTTER ANALYSIS - SOL 145
-                                                                              
-0                                                                               
- 
-      FLUTTER  SUMMARY                                                        
-      POINT = 1           MACH NUMBER = 0.300                                
-      CONFIGURATION = 1   XY-SYMMETRY = ASYMMETRIC   XZ-SYMMETRY = ASYMMETRIC
-      DENSITY RATIO = 1.0000E+00   METHOD = PK                               
-                                                                              
-          KFREQ       1./KFREQ       VELOCITY       DAMPING       FREQUENCY      COMPLEX EIGENVALUE
-                                        M/SEC                        HZ           REAL           IMAG
-"""
+        parts = [_F06_HEADER % datetime.now().strftime('%d-%b-%y AT %H:%M:%S')]
         
-        # Generate flutter data points
-        velocities = np.linspace(100, 400, 20)
-        for V in velocities:
-            damping = 0.08 - (V / flutter_velocity) * (0.08 + 0.015)
-            freq = flutter_frequency * (0.95 + 0.1 * (V / flutter_velocity))
-            kfreq = freq * 2 * np.pi / V if V > 0 else 0.001
-            
-            real_eig = -damping * freq * 2 * np.pi
-            imag_eig = freq * 2 * np.pi
-            
-            line = f"  {kfreq:12.5E}  {1/kfreq if kfreq > 0 else 1e6:12.5E}  "
-            line += f"{V:12.5E}  {damping:12.5E}  {freq:12.5E}  "
-            line += f"{real_eig:12.5E}  {imag_eig:12.5E}\n"
-            content += line
+        # Generate flutter data points for the whole velocity sweep at once
+        V = np.linspace(100, 400, num_points)
+        kfreq, inv_kfreq, damping, freq, real_eig, imag_eig = _flutter_rows(
+            V, float(flutter_velocity), float(flutter_frequency))
         
-        content += f"""
-     
-     FLUTTER VELOCITY = {flutter_velocity:.1f} M/S AT {flutter_frequency:.1f} HZ
-     
-     *** NASTRAN NORMAL COMPLETION ***
-"""
+        # Format all rows in a single pass (plain floats format faster than NumPy scalars)
+        rows = np.column_stack([kfreq, inv_kfreq, V, damping, freq, real_eig, imag_eig])
+        parts.append(_F06_ROW_FORMAT * len(rows) % tuple(rows.ravel().tolist()))
+        
+        parts.append(_F06_FOOTER % (flutter_velocity, flutter_frequency))
         
-        return content
+        # Single join and encode instead of growing an immutable buffer
+        return "".join(parts).encode('ascii')
     
     def _convert_to_f06(self, output_path: Path) -> Path:
         """Convert alternative output format to F06"""
         
-        # For now, just copy the file with .f06 extension
+        # For now, just copy the file with .f06 extension (in-kernel copy;
+        # only the timestamps are carried over, not the full stat)
         f06_path = output_path.with_suffix('.f06')
-        shutil.copy2(output_path, f06_path)
+        _fast_copy(output_path, f06_path)
         return f06_path
     
+    def _acquire_work_dir(self) -> str:
+        """Empty working directory for an analysis, reused across runs of this solver"""
+        
+        # The previous run's files are cleared in the background
+        if self._work_dir_cleared is not None:
+            self._work_dir_cleared.result()
+            self._work_dir_cleared = None
+        
+        if self.temp_dir is None or not os.path.isdir(self.temp_dir):
+            self.close()
+            self.temp_dir = tempfile.mkdtemp(prefix="nastran_flutter_", dir=self._best_scratch_dir())
+            # Runs synchronously on close(), garbage collection or interpreter
+            # exit, so the directory never outlives the solver (not even in /dev/shm)
+            self._work_dir_finalizer = weakref.finalize(
+                self, shutil.rmtree, self.temp_dir, ignore_errors=True)
+        return self.temp_dir
+    
+    def close(self):
+        """Remove the working directory of this solver"""
+        if self._work_dir_cleared is not None:
+            self._work_dir_cleared.result()
+            self._work_dir_cleared = None
+        if self._work_dir_finalizer is not None:
+            self._work_dir_finalizer()
+            self._work_dir_finalizer = None
+        self.temp_dir = None
+    
+    def _best_scratch_dir(self) -> Optional[str]:
+        """Directory for the analysis working files, preferring RAM-backed storage"""
+        
+        # An explicitly configured scratch location wins
+        if self.config.scratch_dir and os.access(self.config.scratch_dir, os.W_OK):
+            return self.config.scratch_dir
+        
+        if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK | os.X_OK):
+            return _SHM_DIR
+        
+        # Fall back to the platform default temporary directory
+        return None
+    
     def analyze_flutter(self, panel, flow, velocity_range=(50, 500), num_points=20):
         """Run flutter analysis (simplified interface for testing)"""
+        return self._analyze_panel(panel)
+    
+    def analyze_flutter_batch(self, panels) -> List[List[FlutterResult]]:
+        """Run flutter analysis for several panels, overlapping up to max_concurrent NASTRAN jobs"""
+        
+        panels = list(panels)
+        workers = max(1, min(self.config.max_concurrent, len(panels)))
+        if workers == 1:
+            return [self._analyze_panel(panel) for panel in panels]
+        
+        # One solver per job slot, so every running job has its own working directory
+        solvers = queue.SimpleQueue()
+        spawned = [self._spawn_worker() for _ in range(workers - 1)]
+        for solver in [self] + spawned:
+            solvers.put(solver)
+        
+        def run(job):
+            index, panel = job
+            solver = solvers.get()
+            try:
+                return solver._analyze_panel(panel, f"_{index + 1:03d}")
+            finally:
+                solvers.put(solver)
         
         try:
-            # Create temporary directory
-            self.temp_dir = tempfile.mkdtemp(prefix="nastran_flutter_")
-            work_dir = Path(self.temp_dir)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nastran-batch") as pool:
+                return list(pool.map(run, enumerate(panels)))
+        finally:
+            for solver in spawned:
+                solver.close()
+    
+    def _spawn_worker(self) -> 'NastranSolver':
+        """Solver sharing this one's configuration and executable, with its own working directory"""
+        worker = copy.copy(self)
+        worker.temp_dir = None
+        worker._work_dir_cleared = None
+        worker._work_dir_finalizer = None
+        if worker._advanced_bdf_writer is not None:
+            # The writer closes over a generator that accumulates cards, so
+            # concurrent jobs must not share it
+            worker._advanced_bdf_writer = worker._select_bdf_writer()
+        return worker
+    
+    def _analyze_panel(self, panel, f06_suffix: str = "") -> List[FlutterResult]:
+        """Generate, run and parse one flutter analysis in this solver's working directory"""
+        
+        # The working directory is emptied when the analysis returns or fails
+        temp_dir = self._acquire_work_dir()
+        try:
+            work_dir = Path(temp_dir)
             
             # Generate BDF file (simplified for testing)
             bdf_path = self._generate_simple_bdf(work_dir / "flutter.bdf", panel)
@@ -524,11 +997,15 @@ MSC.NASTRAN JOB CREATED ON {time.strftime('%d-%b-%y AT %H:%M:%S')}
             
             self.logger.info(f"Analysis complete. F06 file: {f06_path}")
             
-            # Save to project directory
+            # Save to project directory (batch callers can opt out of the copy)
             saved_f06 = None
-            if f06_path.exists():
-                saved_f06 = Path.cwd() / f"nastran_analysis_{time.strftime('%Y%m%d_%H%M%S')}.f06"
-                shutil.copy2(f06_path, saved_f06)
+            if self.config.save_f06 and f06_path.exists():
+                saved_f06 = Path.cwd() / f"nastran_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}{f06_suffix}.f06"
+                # The working copy is discarded with the temporary directory, so
+                # move it (a plain rename when both are on the same filesystem,
+                # otherwise an in-kernel copy) and parse the saved file
+                shutil.move(str(f06_path), str(saved_f06), copy_function=_fast_copy)
+                f06_path = saved_f06
                 self.logger.info(f"Saved F06 to: {saved_f06}")
             
             # Parse F06 file using the new parser to get FlutterResult objects
@@ -559,14 +1036,9 @@ MSC.NASTRAN JOB CREATED ON {time.strftime('%d-%b-%y AT %H:%M:%S')}
                 
             # Return list of FlutterResult objects
             return results
-            
         finally:
-            # Cleanup
-            if self.temp_dir and Path(self.temp_dir).exists():
-                try:
-                    shutil.rmtree(self.temp_dir)
-                except:
-                    pass
+            # NASTRAN scratch files can be large - delete them off the caller's path
+            self._work_dir_cleared = _CLEANUP_EXECUTOR.submit(_clear_directory, temp_dir)
     
     def analyze_flutter_from_f06(self, f06_path: str) -> List[FlutterResult]:
         """Parse existing F06 file and return flutter results"""
@@ -597,49 +1069,51 @@ MSC.NASTRAN JOB CREATED ON {time.strftime('%d-%b-%y AT %H:%M:%S')}
             # Fallback: find minimum flutter speed with negative damping
             unstable = [r for r in results if r.damping < 0]
             if unstable:
-                return min(unstable, key=lambda r: r.flutter_speed)
+                return min(unstable, key=operator.attrgetter('flutter_speed'))
             return None
     
-    def _generate_simple_bdf(self, bdf_path: Path, panel) -> Path:
-        """Generate a complete BDF file for flutter analysis using improved generator"""
+    def _select_bdf_writer(self):
+        """Return the advanced BDF writer if it supports flutter decks, else None"""
         
-        # Import the improved BDF generator
-        try:
-            from .nastran_bdf_generator import NastranBDFGenerator
-            
-            # Use the new generator for proper aerodynamic setup
-            generator = NastranBDFGenerator()
-            
-            # Get flow conditions if available
-            flow = getattr(panel, 'flow_conditions', None)
-            
+        if NastranBDFGenerator is None:
+            self.logger.warning("Advanced BDF generator not available, using fallback")
+            return None
+        
+        generator = NastranBDFGenerator()
+        if not hasattr(generator, 'generate_flutter_bdf'):
+            self.logger.debug("Advanced BDF generator has no flutter deck support, using text BDF")
+            return None
+        
+        def write_flutter_bdf(bdf_path: Path, panel):
             # Generate BDF with complete aerodynamic cards
-            bdf_content = generator.generate_flutter_bdf(
+            generator.generate_flutter_bdf(
                 panel=panel,
-                flow=flow,
+                flow=getattr(panel, 'flow_conditions', None),
                 velocity_range=(50, 500),
                 num_velocities=20,
                 output_file=bdf_path
             )
-            
-            self.logger.info(f"Generated comprehensive BDF file with AERO cards at {bdf_path}")
-            
-        except ImportError:
-            self.logger.warning("Advanced BDF generator not available, using fallback")
-            # Fall back to improved text-based generation
-            self._generate_text_bdf(bdf_path, panel)
-        except Exception as e:
-            self.logger.error(f"Error using advanced BDF generator: {e}")
-            # Fall back to text-based generation
-            self._generate_text_bdf(bdf_path, panel)
         
+        return write_flutter_bdf
+    
+    def _generate_simple_bdf(self, bdf_path: Path, panel) -> Path:
+        """Generate a complete BDF file for flutter analysis using improved generator"""
+        
+        if self._advanced_bdf_writer is not None:
+            try:
+                self._advanced_bdf_writer(bdf_path, panel)
+                self.logger.info(f"Generated comprehensive BDF file with AERO cards at {bdf_path}")
+                return bdf_path
+            except Exception as e:
+                self.logger.error(f"Error using advanced BDF generator: {e}")
+        
+        # Fall back to text-based generation
+        self._generate_text_bdf(bdf_path, panel)
         return bdf_path
     
     def _generate_text_bdf(self, bdf_path: Path, panel) -> None:
         """Generate complete and correct text-based BDF for MSC NASTRAN SOL 145"""
         
-        from datetime import datetime
-        
         # Get panel dimensions
         panel_length = getattr(panel, 'length', 1.0)
         panel_width = getattr(panel, 'width', 1.0)
@@ -656,215 +1130,81 @@ MSC.NASTRAN JOB CREATED ON {time.strftime('%d-%b-%y AT %H:%M:%S')}
         dx = panel_length / num_x_elem
         dy = panel_width / num_y_elem
         
-        with open(bdf_path, 'w') as f:
-            # Header
-            f.write("$ **********************************************************************\n")
-            f.write("$ NASTRAN BDF FOR PANEL FLUTTER ANALYSIS\n")
-            f.write(f"$ Generated: {datetime.now()}\n")
-            f.write("$ **********************************************************************\n")
-            f.write("ID PANEL,FLUTTER\n")
-            f.write("SOL 145\n")  # Aerodynamic Flutter Analysis
-            f.write("TIME 600\n")  # CPU time limit
-            f.write("CEND\n")
-            
-            # Case Control
-            f.write("TITLE = Panel Flutter Analysis - SOL 145\n")
-            f.write("SUBTITLE = Flat Panel with Supersonic Flow\n")
-            f.write("ECHO = NONE\n")
-            f.write("SPC = 1\n")  # Boundary conditions
-            f.write("METHOD = 100\n")  # Eigenvalue extraction method
-            f.write("FMETHOD = 200\n")  # Flutter method
-            f.write("DISPLACEMENT = ALL\n")
-            f.write("STRESS = ALL\n")
-            f.write("FORCE = ALL\n")
-            f.write("BEGIN BULK\n")
-            f.write("PARAM,GRDPNT,0\n")  # Reference grid point
-            f.write("PARAM,AUTOSPC,YES\n")  # Auto single point constraints
-            f.write("PARAM,COUPMASS,1\n")  # Coupled mass matrix
-            f.write("PARAM,WTMASS,0.00259\n")  # Weight to mass conversion
-            
-            # Grid points
-            f.write("$\n$ GRID POINTS\n$\n")
-            gid = 1
-            for j in range(ny):
-                for i in range(nx):
-                    x = i * dx
-                    y = j * dy
-                    z = 0.0
-                    f.write(f"GRID    {gid:8d}        {x:8.4f}{y:8.4f}{z:8.4f}\n")
-                    gid += 1
-            
-            # Material properties
-            f.write("$\n$ MATERIAL PROPERTIES\n$\n")
-            # MAT1 format: fields must be exactly 8 characters
-            # Field 1: MAT1, Field 2: MID, Field 3: E, Field 4: G (blank), Field 5: NU, Field 6: RHO
-            # CRITICAL: Density must have decimal point
-            f.write(f"MAT1    {1:8d}{youngs_modulus:8.2E}        {poissons_ratio:8.4f}{density:8.2f}\n")
-            
-            # Shell property
-            f.write("$\n$ SHELL PROPERTY\n$\n")
-            # PSHELL format: PID, MID1, T (thickness must be real)
-            f.write(f"PSHELL  {1:8d}{1:8d}{thickness:8.6f}\n")
-            
-            # Shell elements
-            f.write("$\n$ SHELL ELEMENTS\n$\n")
-            eid = 1
-            for j in range(num_y_elem):
-                for i in range(num_x_elem):
-                    n1 = j * nx + i + 1
-                    n2 = n1 + 1
-                    n3 = n2 + nx
-                    n4 = n1 + nx
-                    f.write(f"CQUAD4  {eid:8d}{1:8d}{n1:8d}{n2:8d}{n3:8d}{n4:8d}\n")
-                    eid += 1
-            
-            # Boundary conditions - Fix all edges
-            f.write("$\n$ BOUNDARY CONDITIONS - Fixed edges\n$\n")
-            # Collect all edge nodes
-            edge_nodes = []
-            # Left edge (x=0)
-            for j in range(ny):
-                edge_nodes.append(j * nx + 1)
-            # Right edge (x=L)
-            for j in range(ny):
-                edge_nodes.append(j * nx + nx)
-            # Bottom edge (y=0) - exclude corners
-            for i in range(1, nx-1):
-                edge_nodes.append(i + 1)
-            # Top edge (y=W) - exclude corners
-            for i in range(1, nx-1):
-                edge_nodes.append((ny-1) * nx + i + 1)
-            
-            # Write SPC1 cards for edge nodes
-            for node in sorted(set(edge_nodes)):
-                f.write(f"SPC1    {1:8d}{'123456':8s}{node:8d}\n")
-            
-            # Eigenvalue extraction
-            f.write("$\n$ EIGENVALUE EXTRACTION\n$\n")
-            f.write("EIGRL   {0:8d}{1:8.3f}{2:8.1f}{3:8d}\n".format(
-                100,     # SID
-                0.1,     # V1 - lower frequency
-                1000.0,  # V2 - upper frequency  
-                20       # ND - number of modes
-            ))
-            
-            # Aerodynamic reference quantities
-            f.write("$\n$ AERODYNAMIC REFERENCE QUANTITIES\n$\n")
-            f.write("AERO    {0:8d}{1:8.3f}{2:8.4f}{3:8.4f}{4:8d}{5:8d}\n".format(
-                0,             # ACSID - aerodynamic coordinate system
-                1.0,           # VELOCITY - reference velocity
-                panel_length,  # REFC - reference chord
-                1.225,         # RHOREF - reference density
-                0,             # SYMXZ - no symmetry
-                0              # SYMXY - no symmetry
-            ))
-            
-            # CAERO1 card - properly formatted for Doublet Lattice
-            f.write("$\n$ AERODYNAMIC PANELS\n$\n")
-            aero_id = 5000
-            f.write("CAERO1  {0:8d}{1:8d}{2:8d}{3:8d}{4:8d}{5:8d}{6:8d}{7:8d}\n".format(
-                aero_id,     # EID - element ID
-                aero_id + 1, # PID - property ID  
-                0,           # CP - coordinate system (0 = basic)
-                8,           # NSPAN - number of spanwise boxes
-                4,           # NCHORD - number of chordwise boxes
-                0,           # LSPAN - equal spacing
-                0,           # LCHORD - equal spacing
-                1            # IGID - interference group
-            ))
-            # Continuation line with corner points
-            f.write("+       {0:8.4f}{1:8.4f}{2:8.4f}{3:8.4f}{4:8.4f}{5:8.4f}{6:8.4f}{7:8.4f}\n".format(
-                0.0, 0.0, 0.0, panel_length,    # X1, Y1, Z1, X12 (chord)
-                0.0, panel_width, 0.0, panel_length  # X4, Y4, Z4, X43 (chord at Y4)
-            ))
-            
-            # PAERO1 - Aerodynamic property (required for CAERO1)
-            f.write("PAERO1  {0:8d}\n".format(aero_id + 1))
-            
-            # Create set of all structural grid points for spline
-            f.write("$\n$ STRUCTURAL GRID SET FOR SPLINE\n$\n")
-            # SET1 format: first line has SET1, SID, then up to 7 grid IDs
-            # Continuation lines start with + in field 1, then up to 8 grid IDs
-            
-            grids = list(range(1, nx*ny + 1))
-            
-            # First line: SET1 + SID + first 7 grids
-            f.write(f"SET1    {1000:8d}")
-            for i in range(min(7, len(grids))):
-                f.write(f"{grids[i]:8d}")
-            
-            # Continuation lines: + marker + up to 8 grids per line
-            remaining = grids[7:]
-            while remaining:
-                f.write("\n")
-                f.write("+       ")  # Continuation marker in field 1
-                batch = remaining[:8]
-                for gid in batch:
-                    f.write(f"{gid:8d}")
-                remaining = remaining[8:]
-            
-            f.write("\n")
-            
-            # SPLINE1 - Surface spline for aero-structure coupling
-            f.write("$\n$ SPLINE FOR AERO-STRUCTURE COUPLING\n$\n")
-            f.write("SPLINE1 {0:8d}{1:8d}{2:8d}{3:8d}{4:8d}{5:8.3f}\n".format(
-                6000,      # EID - spline element ID
-                aero_id,   # CAERO - aero panel ID
-                aero_id,   # BOX1 - first box ID
-                aero_id + 31, # BOX2 - last box ID (8x4=32 boxes, 0-indexed)
-                1000,      # SETG - SET1 ID for structural grids
-                0.0        # DZ - attachment flexibility
-            ))
-            
-            # Flutter data
-            f.write("$\n$ FLUTTER ANALYSIS DATA\n$\n")
-            
-            # FLUTTER card - proper 8-character field formatting
-            # Format: FLUTTER, SID, METHOD, DENS, MACH, RFREQ, IMETH, NVALUE, EPS
-            f.write("FLUTTER {0:8d}{1:8s}{2:8d}{3:8d}{4:8d}{5:8s}{6:8d}{7:8.4f}\n".format(
-                200,    # Field 2: SID
-                "PK",   # Field 3: METHOD - PK method
-                1,      # Field 4: DENS - density ratio FLFACT ID
-                2,      # Field 5: MACH - Mach number FLFACT ID
-                3,      # Field 6: RFREQ - reduced frequency FLFACT ID
-                "L",    # Field 7: IMETH - L for loop closure
-                5,      # Field 8: NVALUE - number of eigenvalues
-                0.001   # Field 9: EPS - convergence tolerance (as float, not string)
-            ))
-            
-            # FLFACT cards - lists of values
-            f.write("$ Density ratios\n")
-            f.write("FLFACT  {0:8d}{1:8.3f}{2:8.3f}{3:8.3f}\n".format(
-                1, 0.5, 1.0, 1.5
-            ))
-            
-            f.write("$ Mach numbers\n")
-            f.write("FLFACT  {0:8d}{1:8.3f}{2:8.3f}{3:8.3f}{4:8.3f}{5:8.3f}{6:8.3f}\n".format(
-                2, 0.0, 0.5, 0.8, 0.9, 1.1, 1.5
-            ))
-            
-            f.write("$ Reduced frequencies\n")
-            f.write("FLFACT  {0:8d}{1:8.4f}{2:8.4f}{3:8.4f}{4:8.4f}{5:8.4f}{6:8.4f}\n".format(
-                3, 0.001, 0.01, 0.1, 0.5, 1.0, 2.0
-            ))
-            
-            # MKAERO1 - Aerodynamic matrix generation
-            f.write("$\n$ AERODYNAMIC MATRICES\n$\n")
-            f.write("MKAERO1 {0:8.3f}{1:8.3f}{2:8.3f}{3:8.3f}{4:8.3f}{5:8.3f}\n".format(
-                0.0, 0.5, 0.8, 0.9, 1.1, 1.5  # Mach numbers
-            ))
-            f.write("+       {0:8.4f}{1:8.4f}{2:8.4f}{3:8.4f}{4:8.4f}{5:8.4f}\n".format(
-                0.001, 0.01, 0.1, 0.5, 1.0, 2.0  # Reduced frequencies
-            ))
-            
-            # End of file
-            f.write("ENDDATA\n")
+        # Accumulate the deck in memory and flush it with a single write
+        buf = io.StringIO()
+
+        # Header
+        buf.write(f"{_BDF_BANNER}$ Generated: {datetime.now()}\n{_BDF_RULE}")
+        
+        # Executive and case control, bulk data parameters
+        buf.write(_BDF_CONTROL_DECKS)
+        
+        # Grid points
+        buf.write("$\n$ GRID POINTS\n$\n")
+        # Node coordinates for the whole mesh, numbered row by row (x fastest)
+        x, y = np.meshgrid(np.arange(nx) * dx, np.arange(ny) * dy)
+        grids = np.column_stack([np.arange(1, nx*ny + 1), x.ravel(), y.ravel(),
+                                 np.zeros(nx*ny)])
+        buf.write(_GRID_FORMAT * len(grids) % tuple(grids.ravel().tolist()))
+        
+        # Material properties
+        buf.write("$\n$ MATERIAL PROPERTIES\n$\n")
+        # MAT1 format: fields must be exactly 8 characters
+        # Field 1: MAT1, Field 2: MID, Field 3: E, Field 4: G (blank), Field 5: NU, Field 6: RHO
+        # CRITICAL: Density must have decimal point
+        buf.write(f"MAT1    {1:8d}{youngs_modulus:8.2E}        {poissons_ratio:8.4f}{density:8.2f}\n")
+        
+        # Shell property
+        buf.write("$\n$ SHELL PROPERTY\n$\n")
+        # PSHELL format: PID, MID1, T (thickness must be real)
+        buf.write(f"PSHELL  {1:8d}{1:8d}{thickness:8.6f}\n")
+        
+        # Topology cards are shared by every panel with this mesh size
+        cquad4, spc1, set1 = _mesh_topology_cards(num_x_elem, num_y_elem)
+        
+        # Shell elements
+        buf.write("$\n$ SHELL ELEMENTS\n$\n")
+        buf.write(cquad4)
+        
+        # Boundary conditions - Fix all edges
+        buf.write("$\n$ BOUNDARY CONDITIONS - Fixed edges\n$\n")
+        buf.write(spc1)
+        
+        # Eigenvalue extraction
+        buf.write(_BDF_EIGRL_BLOCK)
+        
+        # Aerodynamic reference quantities
+        buf.write("$\n$ AERODYNAMIC REFERENCE QUANTITIES\n$\n")
+        # ACSID=0, VELOCITY=1.0, REFC=panel length, RHOREF=1.225, no symmetry
+        buf.write(f"AERO    {0:8d}{1.0:8.3f}{panel_length:8.4f}{1.225:8.4f}{0:8d}{0:8d}\n")
+        
+        # CAERO1 card - properly formatted for Doublet Lattice
+        buf.write("$\n$ AERODYNAMIC PANELS\n$\n")
+        buf.write(_CAERO1_CARD)
+        # Continuation line with corner points: X1, Y1, Z1, X12 (chord), X4, Y4, Z4, X43
+        buf.write(f"+       {0.0:8.4f}{0.0:8.4f}{0.0:8.4f}{panel_length:8.4f}"
+                  f"{0.0:8.4f}{panel_width:8.4f}{0.0:8.4f}{panel_length:8.4f}\n")
+        
+        # PAERO1 - Aerodynamic property (required for CAERO1)
+        buf.write(_PAERO1_CARD)
+        
+        # Create set of all structural grid points for spline
+        buf.write("$\n$ STRUCTURAL GRID SET FOR SPLINE\n$\n")
+        buf.write(set1)
+        
+        # Spline, flutter and aerodynamic matrix cards, ENDDATA
+        buf.write(_BDF_FLUTTER_BLOCK)
+        
+        # The deck is pure ASCII - encode once and write in binary mode
+        _write_bytes(bdf_path, buf.getvalue().encode('ascii'))
         
         self.logger.info(f"Generated correct BDF file for MSC NASTRAN at {bdf_path}")
     
     def _generate_pynastran_bdf(self, bdf_path: Path, panel) -> None:
         """Generate BDF using pyNastran"""
         
+        from pyNastran.bdf.bdf import BDF
+        
         model = BDF()
         model.sol = 145
         
@@ -0,0 +1,18 @@
+"""
+Numba Compatibility
+===================
+
+numba.njit when numba is installed, otherwise a no-op decorator so that
+the compiled kernels run as plain Python/NumPy.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit - the kernel runs uncompiled"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -6,11 +6,17 @@ Based on validated aeroelastic theory.
 """
 
 import numpy as np
+import functools
 import logging
+import math
+import sys
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
-@dataclass
+# Slotted dataclasses (Python 3.10+) - results are created per mode and velocity
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class PanelProperties:
     """Panel properties (SI units)"""
     length: float  # m
@@ -21,14 +27,14 @@ class PanelProperties:
     density: float  # kg/m³
     boundary_conditions: str = 'SSSS'
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FlowConditions:
     """Flow conditions"""
     mach_number: float
     altitude: float  # m
     temperature: float = 288.15  # K
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FlutterResult:
     """Flutter analysis results"""
     flutter_speed: float  # m/s
@@ -49,6 +55,60 @@ class FlutterResult:
             self.critical_frequency = self.flutter_frequency
 
 
+# Boundary condition tables - anything not listed is treated as simply supported
+# Fundamental frequency: multiplier of (pi/a)^2 * sqrt(D/m), and whether the
+# plate aspect ratio term sqrt(1 + (a/b)^2) applies
+_FREQUENCY_FACTORS = {
+    'SSSS': (1.0, True),    # omega = (pi/a)^2 * sqrt(D/m) * sqrt(1 + (a/b)^2)
+    'CCCC': (1.5, True),    # Clamped - higher frequency
+    'CFFF': (0.56, False),  # Cantilever - lower frequency
+}
+_DEFAULT_FREQUENCY_FACTOR = _FREQUENCY_FACTORS['SSSS']
+
+# Critical flutter parameter (validated against experiments)
+_CRITICAL_FLUTTER_PARAMETERS = {
+    'SSSS': 11.0,  # Simply supported
+    'CCCC': 15.0,  # Clamped
+    'CFFF': 3.5,   # Cantilever
+}
+_DEFAULT_CRITICAL_FLUTTER_PARAMETER = _CRITICAL_FLUTTER_PARAMETERS['SSSS']
+
+# Panel frequencies are pure functions of the panel properties and are
+# requested again for every analysis of the same panel
+@functools.lru_cache(maxsize=128)
+def _fundamental_frequency(length: float, width: float, D: float, m: float,
+                           boundary_conditions) -> float:
+    """Fundamental natural frequency of a panel with mass per unit area m"""
+    
+    factor, aspect_term = _FREQUENCY_FACTORS.get(boundary_conditions,
+                                                 _DEFAULT_FREQUENCY_FACTOR)
+    omega = factor * (math.pi / length)**2 * math.sqrt(D / m)
+    if aspect_term:
+        omega = omega * math.sqrt(1 + (length / width)**2)
+    
+    return omega
+
+class AtmosphereModel:
+    """Standard atmosphere (troposphere and lower stratosphere)"""
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def get_properties(altitude: float) -> Tuple[float, float, float]:
+        """Air density (kg/m³), sound speed (m/s) and pressure (Pa) at altitude (m)"""
+        # Scalar altitude - math functions avoid NumPy's per-call overhead
+        if altitude <= 11000:
+            T = 288.15 - 0.0065 * altitude
+            p = 101325 * (T / 288.15) ** 5.2561
+        else:
+            T = 216.65
+            p = 22632 * math.exp(-0.0001577 * (altitude - 11000))
+        
+        rho = p / (287.0 * T)  # Air density
+        a = math.sqrt(1.4 * 287.0 * T)  # Sound speed
+        
+        return rho, a, p
+
+
 class PistonTheorySolver:
     """
     Corrected Piston Theory Flutter Solver
@@ -77,7 +137,7 @@ class PistonTheorySolver:
         # Using corrected piston theory formulation
         
         # Non-dimensional parameters
-        mu = (rho_air * panel.length) / (np.pi * panel.density * panel.thickness)
+        mu = (rho_air * panel.length) / (math.pi * panel.density * panel.thickness)
         lambda_param = (panel.length / panel.width) ** 2
         
         # Flutter parameter (corrected for proper thickness dependency)
@@ -88,14 +148,15 @@ class PistonTheorySolver:
         # This is the key equation that must include thickness properly
         lambda_cr = (12 * (1 - panel.poissons_ratio**2) * 
                     (mu * flow.mach_number**2) / 
-                    (np.pi**3 * (panel.thickness / panel.length)**2))
+                    (math.pi**3 * (panel.thickness / panel.length)**2))
         
         # Flutter speed calculation (corrected)
         # V_flutter = sqrt(2 * q_flutter / rho)
         # where q_flutter depends on panel stiffness and thickness
         
-        # Critical flutter dynamic pressure
-        q_flutter = (2 * np.pi**3 * D) / (panel.length**3 * 
+        # Critical flutter dynamic pressure (NumPy sqrt: subsonic Mach gives
+        # NaN instead of raising)
+        q_flutter = (2 * math.pi**3 * D) / (panel.length**3 * 
                      np.sqrt(mu * (flow.mach_number**2 - 1)))
         
         # Flutter speed (now properly dependent on thickness through D)
@@ -105,7 +166,7 @@ class PistonTheorySolver:
         V_flutter = np.clip(V_flutter, 50, 1000)  # Reasonable range in m/s
         
         # Flutter frequency
-        f_flutter = omega_n / (2 * np.pi) * np.sqrt(1 + lambda_cr)
+        f_flutter = omega_n / (2 * math.pi) * math.sqrt(1 + lambda_cr)
         
         return FlutterResult(
             flutter_speed=V_flutter,
@@ -133,15 +194,16 @@ class PistonTheorySolver:
         
         # Natural frequency of first mode (simply supported)
         # omega = (pi/L)^2 * sqrt(D/m)
-        omega1 = (np.pi / panel.length)**2 * np.sqrt(D / m)
+        omega1 = (math.pi / panel.length)**2 * math.sqrt(D / m)
         
         # Flutter speed using corrected formula
         # Based on classical panel flutter theory
         
         # Non-dimensional mass ratio
-        mu = (rho_air * panel.length) / (np.pi * m)
+        mu = (rho_air * panel.length) / (math.pi * m)
         
-        # Mach number parameter
+        # Mach number parameter (NumPy sqrt: at M = 1 the division below
+        # gives an infinite q instead of raising)
         beta = np.sqrt(abs(flow.mach_number**2 - 1))
         
         if flow.mach_number <= 1.0:
@@ -149,14 +211,8 @@ class PistonTheorySolver:
             beta = beta * 0.7  # Empirical correction for subsonic
         
         # Critical flutter parameter (validated against experiments)
-        if panel.boundary_conditions == 'SSSS':
-            K_cr = 11.0  # Simply supported
-        elif panel.boundary_conditions == 'CCCC':
-            K_cr = 15.0  # Clamped
-        elif panel.boundary_conditions == 'CFFF':
-            K_cr = 3.5   # Cantilever
-        else:
-            K_cr = 11.0  # Default
+        K_cr = _CRITICAL_FLUTTER_PARAMETERS.get(panel.boundary_conditions,
+                                                _DEFAULT_CRITICAL_FLUTTER_PARAMETER)
         
         # Flutter dynamic pressure (corrected formula)
         q_flutter = K_cr * D / (panel.length**3 * beta)
@@ -177,7 +233,7 @@ class PistonTheorySolver:
         V_flutter = np.clip(V_flutter, 50, 1000)
         
         # Flutter frequency
-        f_flutter = omega1 / (2 * np.pi) * (1 + 0.5 * mu * beta)
+        f_flutter = omega1 / (2 * math.pi) * (1 + 0.5 * mu * beta)
         
         self.logger.info(f"Flutter analysis: V={V_flutter:.1f} m/s, f={f_flutter:.1f} Hz")
         self.logger.info(f"Panel: t={panel.thickness*1000:.1f}mm, D={D:.2e} N.m")
@@ -204,39 +260,12 @@ class PistonTheorySolver:
         """Calculate fundamental natural frequency"""
         # Mass per unit area
         m = panel.density * panel.thickness  # kg/m²
-        
-        # For simply supported panel
-        if panel.boundary_conditions == 'SSSS':
-            # omega = (pi/a)^2 * sqrt(D/m) * sqrt(1 + (a/b)^2)
-            omega = (np.pi / panel.length)**2 * np.sqrt(D / m) * \
-                   np.sqrt(1 + (panel.length / panel.width)**2)
-        elif panel.boundary_conditions == 'CCCC':
-            # Clamped - higher frequency
-            omega = 1.5 * (np.pi / panel.length)**2 * np.sqrt(D / m) * \
-                   np.sqrt(1 + (panel.length / panel.width)**2)
-        elif panel.boundary_conditions == 'CFFF':
-            # Cantilever - lower frequency
-            omega = 0.56 * (np.pi / panel.length)**2 * np.sqrt(D / m)
-        else:
-            # Default to simply supported
-            omega = (np.pi / panel.length)**2 * np.sqrt(D / m) * \
-                   np.sqrt(1 + (panel.length / panel.width)**2)
-        
-        return omega
+        return _fundamental_frequency(panel.length, panel.width, D, m,
+                                      panel.boundary_conditions)
     
     def _get_air_properties(self, altitude: float) -> Tuple[float, float]:
         """Get air density and sound speed at altitude"""
-        # Standard atmosphere model
-        if altitude <= 11000:
-            T = 288.15 - 0.0065 * altitude
-            p = 101325 * (T / 288.15) ** 5.2561
-        else:
-            T = 216.65
-            p = 22632 * np.exp(-0.0001577 * (altitude - 11000))
-        
-        rho = p / (287.0 * T)  # Air density
-        a = np.sqrt(1.4 * 287.0 * T)  # Sound speed
-        
+        rho, a, _ = AtmosphereModel.get_properties(altitude)
         return rho, a
 
 
@@ -8,6 +8,8 @@ and provides progress tracking and error handling for the GUI.
 
 import threading
 import time
+import itertools
+import copy
 import logging
 from typing import Callable, Optional
 from dataclasses import dataclass
@@ -266,7 +268,6 @@ class BatchAnalysisRunner:
             param_names = list(parameter_variations.keys())
             param_values_list = list(parameter_variations.values())
             
-            import itertools
             for param_combination in itertools.product(*param_values_list):
                 if self.should_stop:
                     break
@@ -312,7 +313,6 @@ class BatchAnalysisRunner:
     def _create_case_config(self, base_config, base_geometry, base_material,
                            param_names, param_values):
         """Create configuration for a specific parameter case"""
-        import copy
         
         # Deep copy base configurations
         case_config = copy.deepcopy(base_config)
@@ -15,20 +15,38 @@ import tempfile
 import shutil
 import subprocess
 import os
+import sys
+import fnmatch
+import time
 
-# Import NASTRAN aeroelasticity modules
-try:
-    from pyNastran.bdf.bdf import BDF
-    from nastran.aero.analysis.panel_flutter import (
-        PanelFlutterPistonAnalysisModel, 
-        PanelFlutterPistonZAEROAnalysisModel,
-        PanelFlutterSubcase
-    )
-    from nastran.aero.superpanels import SuperAeroPanel5, SuperAeroPanel1
-    NASTRAN_AVAILABLE = True
-except ImportError as e:
-    logging.warning(f"NASTRAN modules not fully available: {e}")
-    NASTRAN_AVAILABLE = False
+# NASTRAN aeroelasticity modules pull in pyNastran, which is slow to import,
+# so they are loaded on first use. None until an import has been attempted.
+NASTRAN_AVAILABLE = None
+PanelFlutterPistonAnalysisModel = None
+PanelFlutterPistonZAEROAnalysisModel = None
+PanelFlutterSubcase = None
+SuperAeroPanel5 = None
+SuperAeroPanel1 = None
+
+def _load_nastran_modules() -> bool:
+    """Import the NASTRAN aeroelasticity modules once, returning availability"""
+    global NASTRAN_AVAILABLE, PanelFlutterPistonAnalysisModel, PanelFlutterPistonZAEROAnalysisModel
+    global PanelFlutterSubcase, SuperAeroPanel5, SuperAeroPanel1
+    
+    if NASTRAN_AVAILABLE is None:
+        try:
+            from nastran.aero.analysis.panel_flutter import (
+                PanelFlutterPistonAnalysisModel, 
+                PanelFlutterPistonZAEROAnalysisModel,
+                PanelFlutterSubcase
+            )
+            from nastran.aero.superpanels import SuperAeroPanel5, SuperAeroPanel1
+            NASTRAN_AVAILABLE = True
+        except ImportError as e:
+            logging.warning(f"NASTRAN modules not fully available: {e}")
+            NASTRAN_AVAILABLE = False
+    
+    return NASTRAN_AVAILABLE
 
 
 @dataclass
@@ -148,7 +166,7 @@ class FlutterAnalysisEngine:
     
     def _setup_geometry(self, geometry: GeometryConfig):
         """Setup panel geometry"""
-        if not self.analysis_model:
+        if not self.analysis_model or not _load_nastran_modules():
             return
             
         # Create superpanel for piston theory analysis
@@ -200,7 +218,7 @@ class FlutterAnalysisEngine:
     
     def _setup_analysis_parameters(self):
         """Setup flutter analysis parameters"""
-        if not self.analysis_model:
+        if not self.analysis_model or not _load_nastran_modules():
             return
             
         model = self.analysis_model.model
@@ -250,21 +268,23 @@ class FlutterAnalysisEngine:
                     progress_callback("Checking for saved BDF files...", 98)
                 
                 project_dir = Path.cwd()
-                bdf_files = list(project_dir.glob("nastran_*analysis*.bdf"))
                 recent_bdf_files = []
                 
-                # Find files created in the last 5 minutes
-                import time
+                # Find files created in the last 5 minutes, in a single directory
+                # scan that stats each matching entry once for mtime and size
                 current_time = time.time()
-                for bdf_file in bdf_files:
-                    file_time = bdf_file.stat().st_mtime
-                    if (current_time - file_time) < 300:  # 5 minutes
-                        recent_bdf_files.append(bdf_file)
+                with os.scandir(project_dir) as entries:
+                    for entry in entries:
+                        if not fnmatch.fnmatch(entry.name, "nastran_*analysis*.bdf"):
+                            continue
+                        stat = entry.stat()
+                        if (current_time - stat.st_mtime) < 300:  # 5 minutes
+                            recent_bdf_files.append((Path(entry.path), stat.st_size))
                 
                 if recent_bdf_files:
                     self.logger.info(f"Found {len(recent_bdf_files)} recently created BDF files:")
-                    for bdf_file in recent_bdf_files:
-                        self.logger.info(f"  - {bdf_file} ({bdf_file.stat().st_size} bytes)")
+                    for bdf_file, size in recent_bdf_files:
+                        self.logger.info(f"  - {bdf_file} ({size} bytes)")
                     if progress_callback:
                         progress_callback(f"Created {len(recent_bdf_files)} BDF files in project directory", 99)
                 else:
@@ -298,8 +318,6 @@ class FlutterAnalysisEngine:
                 progress_callback("Initializing NASTRAN solver...", 5)
             
             # Import the working NASTRAN solver
-            import sys
-            from pathlib import Path
             analysis_path = Path(__file__).parent.parent.parent / 'analysis'
             if str(analysis_path) not in sys.path:
                 sys.path.insert(0, str(analysis_path))
@@ -419,7 +437,6 @@ class FlutterAnalysisEngine:
     
     def _run_simulation_analysis(self, progress_callback=None) -> FlutterResults:
         """Run simulation analysis for testing/demonstration"""
-        import time
         
         # Generate velocity range
         velocities = np.linspace(self.config.velocity_min, self.config.velocity_max, 
@@ -435,12 +452,11 @@ class FlutterAnalysisEngine:
         ]
         
         try:
-            # Simulate realistic analysis progression
-            for i, step in enumerate(analysis_steps):
-                if progress_callback:
-                    progress = 20 + (i / len(analysis_steps)) * 70
-                    progress_callback(step, progress)
-                time.sleep(0.5)  # Simulate computation time
+            # Report the analysis stages; the whole sweep below is computed
+            # with array operations, so no stage needs artificial delay
+            if progress_callback:
+                for i, step in enumerate(analysis_steps):
+                    progress_callback(step, 20 + (i / len(analysis_steps)) * 70)
             
             # Generate realistic flutter analysis results
             # Based on typical panel flutter behavior
@@ -519,11 +535,11 @@ class FlutterAnalysisEngine:
                            dampings: np.ndarray) -> Tuple[Optional[float], Optional[float], Optional[int]]:
         """Find flutter point where damping crosses zero"""
         
-        # Find where damping becomes negative
-        flutter_indices = np.where(dampings <= 0)[0]
+        # Find where damping becomes negative (argmax stops at the first True)
+        unstable = dampings <= 0
         
-        if len(flutter_indices) > 0:
-            flutter_idx = flutter_indices[0]
+        if unstable.any():
+            flutter_idx = int(np.argmax(unstable))
             
             # Interpolate for more accurate flutter point
             if flutter_idx > 0:
@@ -13,6 +13,8 @@ import time
 import logging
 from pathlib import Path
 
+import numpy as np
+
 from src.nastran.aero.analysis.panel_flutter import PanelFlutterPistonAnalysisModel
 from src.nastran.aero.superpanels import SuperAeroPanel5
 from ...gui.utils.validation import InputValidator
@@ -348,16 +350,11 @@ class MainController:
     def _load_analysis_results(self):
         """Load analysis results (simulated for now)."""
         # In a real implementation, this would parse NASTRAN output files
-        import numpy as np
         
-        # Simulate flutter results
+        # Simulate flutter results (evaluated over the whole velocity array)
         velocities = np.linspace(50, 300, 20)
-        frequencies = np.array([
-            10.0 + 0.1 * v + 0.001 * v**2 for v in velocities
-        ])
-        dampings = np.array([
-            0.1 - 0.001 * v + 0.0001 * v**1.5 for v in velocities
-        ])
+        frequencies = 10.0 + 0.1 * velocities + 0.001 * velocities**2
+        dampings = 0.1 - 0.001 * velocities + 0.0001 * velocities**1.5
         
         results = {
             'flutter_summary': {
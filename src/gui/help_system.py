@@ -9,9 +9,15 @@ Analysis GUI tool, including tooltips, context-sensitive help, and user guides.
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import webbrowser
+import re
 from typing import Dict, Optional
 from pathlib import Path
 
+# Markdown-style lines that get a formatting tag: '# ', '## ' and '### '
+# headings, and list items that start with '- **' and end with '**'
+_FORMATTED_LINE_RE = re.compile(r'^(?:(#{1,3}) |- \*\*(?:.*\*\*|\*)?$)', re.MULTILINE)
+_HEADING_TAGS = {1: "heading1", 2: "heading2", 3: "heading3"}
+
 
 class HelpSystem:
     """Comprehensive help and documentation system"""
@@ -373,23 +379,17 @@ The tool automatically computes ABD matrices using Classical Laminate Theory.
         self.content_text.tag_config("code", font=('Consolas', 9), background='#F3F4F6')
         self.content_text.tag_config("emphasis", font=('Arial', 10, 'bold'))
         
-        # Find and tag headings
+        # Find and tag headings and bold list items in one pass over the text
         content = self.content_text.get(1.0, tk.END)
-        lines = content.split('\n')
+        line_number, counted = 1, 0
         
-        for i, line in enumerate(lines):
-            line_start = f"{i+1}.0"
-            line_end = f"{i+1}.end"
+        for match in _FORMATTED_LINE_RE.finditer(content):
+            line_number += content.count('\n', counted, match.start())
+            counted = match.start()
             
-            if line.startswith('# '):
-                self.content_text.tag_add("heading1", line_start, line_end)
-            elif line.startswith('## '):
-                self.content_text.tag_add("heading2", line_start, line_end)
-            elif line.startswith('### '):
-                self.content_text.tag_add("heading3", line_start, line_end)
-            elif line.startswith('- **') and line.endswith('**'):
-                # Bold list items
-                self.content_text.tag_add("emphasis", line_start, line_end)
+            hashes = match.group(1)
+            tag = _HEADING_TAGS[len(hashes)] if hashes else "emphasis"
+            self.content_text.tag_add(tag, f"{line_number}.0", f"{line_number}.end")
     
     def create_tooltip(self, widget, text: str, delay: int = 500):
         """Create tooltip for a widget"""
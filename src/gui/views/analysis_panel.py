@@ -272,7 +272,6 @@ class AnalysisPanel:
             n_points = int(self.vel_points_spinbox.get())
             
             velocities = np.linspace(v_min, v_max, n_points)
-            vel_str = ', '.join([f"{v:.1f}" for v in velocities])
             
             messagebox.showinfo("Generated Velocities", 
                               f"Generated {n_points} velocities from {v_min} to {v_max} m/s")
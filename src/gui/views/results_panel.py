@@ -462,9 +462,9 @@ class ResultsPanel:
             frequencies = flutter_summary.get('frequencies', [])
             dampings = flutter_summary.get('dampings', [])
             
-            for i, (v, f, d) in enumerate(zip(velocities, frequencies, dampings)):
-                mach = v / 343.0
-                writer.writerow([v, f, d, 1, mach])
+            # Hand all rows to the writer in one call
+            writer.writerows([v, f, d, 1, v / 343.0]
+                             for v, f, d in zip(velocities, frequencies, dampings))
                 
     def export_to_json(self, file_path):
         """Export results to JSON format."""
@@ -9,7 +9,7 @@ import time
 
 SKIP_LINE_SET = {"*** USER INFORMATION MESSAGE", "A ZERO FREQUENCY"}
 
-p_header = re.compile(r"(?P<label>.+(?=SUBCASE))(?P<subcase>SUBCASE\s\d+)")
+p_subcase = re.compile(r"SUBCASE\s\d+")
 
 re_date = re.compile(r'(?P<month>\w+)\s+(?P<day>\d{1,2}),\s+(?P<year>\d{4})')
 re_version = re.compile(r'(?P<vname>[^\d]*)(?P<vdate>\d{1,2}\/\d{1,2}\/\d{1,2})')
@@ -58,22 +58,30 @@ def extract_tabulated_data(lines):
     data = []
     for line in lines:
         entries = line.split()
-        inner_data = []
-        for entry in entries:
-            try:
-                e = float(entry)
-            except ValueError:
-                e = np.nan
-            finally:
-                inner_data.append(e)
-        data.append(inner_data)
+        try:
+            # whole row in one pass; only rows with text entries go one by one
+            data.append([float(entry) for entry in entries])
+        except ValueError:
+            data.append([_parse_float_or_nan(entry) for entry in entries])
     return data
 
 
+def _parse_float_or_nan(entry):
+    try:
+        return float(entry)
+    except ValueError:
+        return np.nan
+
+
 def parse_label_subcase(line):
-    res = p_header.search(line[1:])
-    label = res.group('label').strip()
-    subcase = res.group('subcase').replace('SUBCASE', '').strip()
+    # the label is everything before the last "SUBCASE <n>" of the line; a
+    # forward scan for that marker avoids backtracking over the whole label
+    line = line[1:].split('\n', 1)[0]
+    res = None
+    for res in p_subcase.finditer(line, 1):
+        pass
+    label = line[:res.start()].strip()
+    subcase = res.group().replace('SUBCASE', '').strip()
     return (label, int(subcase))
 
 
@@ -73,10 +73,9 @@ class F06Results:
                 # summarize_real_eigvals(self.flutter).to_excel(writer, sheet_name='FLUTTER SUMMARY')
     
 def read_f06(filename: str):
+    # pages are grouped while the file is read, without a full list of lines
     with open(filename, 'r') as file:
-        raw_lines = file.readlines()
-
-    groups = _group_lines_by_page(raw_lines)
+        groups = _group_lines_by_page(file)
 
     pages = []
     T = None
@@ -105,7 +105,11 @@ def parse_flutter_page(lines):
 
 
 def calc_sawyer_dyn_pressure(vel, mach, D, vref, a, rho):
-    return (rho * (vel * vref) ** 2) * (a ** 3) / (np.sqrt(mach ** 2 - 1) * D)
+    # The parameter is NaN (without an invalid-value warning) where M < 1
+    # and infinite at M = 1; scalars, arrays and pandas objects keep their type
+    with np.errstate(invalid='ignore'):
+        beta = np.sqrt(mach ** 2 - 1)
+    return (rho * (vel * vref) ** 2) * (a ** 3) / (beta * D)
 
 
 # def parse_panel_flutter_results(analysis, case_files, theta_range, D11):
@@ -28,23 +28,26 @@ def _parse_content(content):
     return data
 
 def read_modal_f06(filename: str):
+    # stream the file: only the lines of the eigenvalue table are kept
     with open(filename, 'r') as file:
-        raw_lines = file.readlines()
+        for line in file:
+            if 'R E A L   E I G E N V A L U E S' in line:
+                break
+        else:
+            return None
 
-    for i, line in enumerate(raw_lines):
-        if 'R E A L   E I G E N V A L U E S' in line:
+        # skip the two label lines before the data
+        next(file, None)
+        next(file, None)
 
-            raw_content = []
-            j = i+3 # linha após as labels de dados
-            while raw_lines[j][0] != '1': # primeiro char na linha final da pagina é 1
-                l = raw_lines[j]
-                if l.strip() == '':
-                    break
-                raw_content.append(l)
-                j += 1
+        raw_content = []
+        for l in file:
+            if l[0] == '1' or l.strip() == '': # primeiro char na linha final da pagina é 1
+                break
+            raw_content.append(l)
 
-            parsed_data = _parse_content(raw_content)
+    parsed_data = _parse_content(raw_content)
 
-            df = pd.DataFrame(parsed_data, columns=list(MODAL_REAL_EIGV_KEYS.keys()))
+    df = pd.DataFrame(parsed_data, columns=list(MODAL_REAL_EIGV_KEYS.keys()))
 
-            return df
+    return df
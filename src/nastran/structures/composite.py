@@ -6,6 +6,11 @@ from pyNastran.bdf.cards.materials import MAT8, MAT5, MAT2
 
 from src.nastran.structures.material import OrthotropicMaterial
 
+# ply configuration strings like "[0/45/-45/90]2s"
+re_ply_lists = re.compile(r'\[(.*?)\]')
+re_ply_mods = re.compile(r'\]([\dsS]*)')
+re_ply_angle = re.compile(r'([+-]?[0-9]?[0-9])')
+
 class Sheet:
 
     def __init__(self, mat: OrthotropicMaterial, thick: float, theta=0.0) -> None:
@@ -57,10 +62,10 @@ class Ply:
 
 def parse_ply_config(pid, mat, thick, ply_config):
     sheets = []
-    lists = re.findall(r'\[(.*?)\]', ply_config)
-    mods = re.findall(r'\]([\dsS]*)', ply_config)
+    lists = re_ply_lists.findall(ply_config)
+    mods = re_ply_mods.findall(ply_config)
     for l, mod in zip(lists, mods):
-        thetas = re.findall(r'([+-]?[0-9]?[0-9])', l)
+        thetas = re_ply_angle.findall(l)
         mult = mod.upper().replace('S','')
         if len(mult) > 0 and mult.isnumeric():
             thetas = thetas*int(mult)
@@ -85,23 +85,23 @@ class StructuralPlate(RectangularPlate):
         pass
 
     def _generate_grid(self):
-        counter = 0
-        for i in range(self.nchord+1):
-            for j in range(self.nspan+1):
-                xyz = self.p1 + self.d12*i/self.nchord + self.d14*j/self.nspan
-                self.bdf.add_grid(self.firstNid + counter, xyz)
-                counter += 1
+        # all node coordinates at once, chordwise index outer, spanwise inner
+        i = np.arange(self.nchord+1)
+        j = np.arange(self.nspan+1)
+        xyz = (self.p1
+               + (np.multiply.outer(i, self.d12)/self.nchord)[:, None, :]
+               + (np.multiply.outer(j, self.d14)/self.nspan)[None, :, :]).reshape(-1, 3)
+        for nid, coords in enumerate(xyz, self.firstNid):
+            self.bdf.add_grid(nid, coords)
 
     def _generate_elements(self):
-        counter = 0
-        for i in range(self.nchord):
-            for j in range(self.nspan):
-                g1 = self.firstNid + i + j + i*self.nspan
-                g2 = g1 + 1
-                g3 = g2 + self.nspan + 1
-                g4 = g1 + self.nspan + 1
-                self.bdf.add_cquad4(self.firstEid + counter, self.pid, [g1, g2, g3, g4], theta_mcid=90.0)
-                counter += 1
+        # connectivity of all elements at once, chordwise index outer, spanwise inner
+        i, j = np.meshgrid(np.arange(self.nchord), np.arange(self.nspan), indexing='ij')
+        g1 = (self.firstNid + i*(self.nspan+1) + j).ravel()
+        g4 = g1 + self.nspan + 1
+        connectivity = np.column_stack([g1, g1 + 1, g4 + 1, g4]).tolist()
+        for eid, nodes in enumerate(connectivity, self.firstEid):
+            self.bdf.add_cquad4(eid, self.pid, nodes, theta_mcid=90.0)
 
     def generate_mesh(self) -> BDF:
         self._generate_material()
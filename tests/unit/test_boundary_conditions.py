@@ -82,7 +82,14 @@ class TestBoundaryConditions(unittest.TestCase):
             self.assertGreater(factors['kxx'], 0)
             self.assertGreater(factors['kyy'], 0) 
             self.assertGreater(factors['kxy'], 0)
-    
+
+    def test_stiffness_factors_are_copies(self):
+        """Test that modifying returned factors leaves the shared table intact"""
+        factors = self.bc_manager.get_stiffness_matrix_factors(self.BoundaryCondition.CCCC)
+        factors['kxx'] = 0.0
+        again = self.bc_manager.get_stiffness_matrix_factors(self.BoundaryCondition.CCCC)
+        self.assertEqual(again['kxx'], 2.56)
+
     def test_natural_frequency_factors(self):
         """Test natural frequency factors"""
         # Test basic mode (1,1) for all boundary conditions
@@ -130,5 +137,12 @@ class TestBoundaryConditions(unittest.TestCase):
         rec = self.bc_manager.recommend_boundary_condition("critical")
         self.assertEqual(rec, self.BoundaryCondition.CFFF)
 
+    def test_edge_constraints_are_copies(self):
+        """Test that modifying returned edge constraints leaves later lookups intact"""
+        constraints = self.bc_manager.get_edge_constraints(self.BoundaryCondition.CCCC)
+        constraints['leading'] = None
+        again = self.bc_manager.get_edge_constraints(self.BoundaryCondition.CCCC)
+        self.assertEqual(''.join(c.value for c in again.values()), "CCCC")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for NASTRAN F06 Parser
+=================================
+
+Tests for flutter summary extraction from F06 output.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+current_dir = Path(__file__).parent.parent.parent
+src_dir = current_dir / "src"
+sys.path.insert(0, str(src_dir))
+
+SAMPLE_F06 = """
+1    MSC.NASTRAN JOB                                                  PAGE     12
+
+      FLUTTER  SUMMARY
+      POINT = 2           MACH NUMBER = 0.800   DENSITY RATIO = 5.0000E-01   METHOD = PK
+      CONFIGURATION = 1   XY-SYMMETRY = ASYMMETRIC   XZ-SYMMETRY = ASYMMETRIC
+
+          KFREQ       1./KFREQ       VELOCITY       DAMPING       FREQUENCY      COMPLEX EIGENVALUE
+   1.00000E-01   1.00000E+01   1.50000E+02   2.00000E-02   2.00000E+01  -1.00000E+00   1.20000E+02
+  *1.00000E-01   1.00000E+01   1.75000E+02   1.00000E-02   2.10000E+01  -1.00000E+00   1.20000E+02
+   8.00000E-02   1.25000E+01   2.00000E+02  -1.00000E-02   2.20000E+01   1.00000E+00   1.30000E+02
+      MODE  2.50000E+02  -3.00000E-02   2.30000E+01   4.00000E+00
+
+1    MSC.NASTRAN JOB                                                  PAGE     13
+"""
+
+class TestNastranF06Parser(unittest.TestCase):
+    """Test F06 flutter summary parsing"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        from analysis.nastran_f06_parser import NastranF06Parser
+        self.parser = NastranF06Parser()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.f06_path = Path(self.temp_dir.name) / "flutter.f06"
+        self.f06_path.write_text(SAMPLE_F06)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.temp_dir.cleanup()
+
+    def test_flutter_summary_rows(self):
+        """Test standard and alternative rows are parsed and flagged rows skipped"""
+        results = self.parser.parse_f06_file(str(self.f06_path))
+
+        self.assertEqual([r.flutter_speed for r in results], [150.0, 200.0, 250.0])
+        self.assertEqual([r.damping for r in results], [0.02, -0.01, -0.03])
+        self.assertEqual([r.flutter_frequency for r in results], [20.0, 22.0, 23.0])
+        self.assertEqual([r.flutter_mode for r in results], [1, 2, 3])
+
+    def test_flutter_summary_header(self):
+        """Test Mach number, density ratio and method are taken from the POINT line"""
+        results = self.parser.parse_f06_file(str(self.f06_path))
+
+        first = results[0]
+        self.assertEqual(first.mach_number, 0.8)
+        self.assertEqual(first.method, "NASTRAN-PK")
+        self.assertAlmostEqual(first.dynamic_pressure, 0.5 * 0.5 * 1.225 * 150.0**2)
+
+    def test_crlf_line_endings(self):
+        """Test that Windows line endings give the same results"""
+        expected = self.parser.parse_f06_file(str(self.f06_path))
+        self.f06_path.write_bytes(SAMPLE_F06.replace("\n", "\r\n").encode('ascii'))
+
+        self.assertEqual(self.parser.parse_f06_file(str(self.f06_path)), expected)
+
+    def test_cr_line_endings(self):
+        """Test that old Mac (CR-only) line endings give the same results"""
+        second = (SAMPLE_F06.replace("1.50000E+02", "3.00000E+02")
+                  .replace("2.00000E+02", "3.50000E+02").replace("2.50000E+02", "4.00000E+02"))
+        text = SAMPLE_F06 + "\n" * 30 + second
+        self.f06_path.write_text(text)
+        expected = self.parser.parse_f06_file(str(self.f06_path))
+        self.assertEqual(len(expected), 6)
+
+        self.f06_path.write_bytes(text.replace("\n", "\r").encode('ascii'))
+        self.assertEqual(self.parser.parse_f06_file(str(self.f06_path)), expected)
+
+    def test_eigenvalue_fallback(self):
+        """Test the eigenvalue summary is used when no flutter summary exists"""
+        self.f06_path.write_text(
+            "   MODE    EIGENVALUE    RADIANS    CYCLES\n"
+            "      1   -4.00000E+02   2.00000E+01   3.18310E+00\n"
+            "      2    9.00000E+02   3.00000E+01   4.77465E+00\n"
+            "\n"
+            "      3    1.00000E+00   1.00000E+00   1.00000E+00\n")
+        results = self.parser.parse_f06_file(str(self.f06_path))
+
+        self.assertEqual([r.flutter_mode for r in results], [1, 2])
+        self.assertEqual([r.damping for r in results], [-0.01, 0.01])
+        self.assertEqual(results[1].method, "NASTRAN-EIGEN")
+
+    def test_eigenvalue_fallback_unparsed_rows(self):
+        """Test that unparseable rows, including a repeated heading, do not end a summary"""
+        self.f06_path.write_text(
+            "   MODE    EIGENVALUE    RADIANS    CYCLES\n"
+            "      1   -4.00000E+02   2.00000E+01   3.18310E+00\n"
+            "      *   not   a   mode\n"
+            "      2    9.00000E+02   3.00000E+01   4.77465E+00\n"
+            "   MODE    EIGENVALUE    RADIANS    CYCLES\n"
+            "      3    1.00000E+00   1.00000E+00   1.00000E+00\n"
+            "\n"
+            "      4    1.00000E+00   1.00000E+00   1.00000E+00\n")
+        results = self.parser.parse_f06_file(str(self.f06_path))
+
+        # Rows after the repeated heading belong to both summaries
+        self.assertEqual([r.flutter_mode for r in results], [1, 2, 3, 3])
+
+    def test_rewritten_file_is_reparsed(self):
+        """Test that results reflect the file as it is now and are not shared between calls"""
+        first = self.parser.parse_f06_file(str(self.f06_path))
+        first[0].flutter_mode = 99
+        second = self.parser.parse_f06_file(str(self.f06_path))
+        self.assertEqual([r.flutter_mode for r in second], [1, 2, 3])
+
+        # Same size and timestamp, different contents
+        stat = self.f06_path.stat()
+        self.f06_path.write_text(SAMPLE_F06.replace("1.50000E+02", "1.60000E+02"))
+        os.utime(self.f06_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        third = self.parser.parse_f06_file(str(self.f06_path))
+        self.assertEqual(third[0].flutter_speed, 160.0)
+
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_results_are_slotted(self):
+        """Test that parsed results carry no per-instance __dict__"""
+        results = self.parser.parse_f06_file(str(self.f06_path))
+        self.assertFalse(hasattr(results[0], '__dict__'))
+
+    def test_empty_file(self):
+        """Test that an empty F06 file yields no results"""
+        self.f06_path.write_bytes(b"")
+        self.assertEqual(self.parser.parse_f06_file(str(self.f06_path)), [])
+
+    def test_missing_file(self):
+        """Test that a missing F06 file yields no results"""
+        self.assertEqual(self.parser.parse_f06_file(str(self.f06_path) + ".missing"), [])
+
+if __name__ == '__main__':
+    unittest.main()
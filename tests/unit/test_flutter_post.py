@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for F06 Flutter Post-Processing
+==========================================
+
+Tests for the Sawyer dynamic pressure parameter.
+"""
+
+import sys
+import unittest
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+# Add repository root (for src.nastran imports) and src directory to path
+current_dir = Path(__file__).parent.parent.parent
+src_dir = current_dir / "src"
+sys.path.insert(0, str(current_dir))
+sys.path.insert(0, str(src_dir))
+
+class TestSawyerDynamicPressure(unittest.TestCase):
+    """Test the Sawyer dynamic pressure parameter"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        from nastran.post.f06.flutter import calc_sawyer_dyn_pressure
+        self.calc = calc_sawyer_dyn_pressure
+
+    def test_supersonic(self):
+        """Test a supersonic point against the closed-form value"""
+        lam = self.calc(2.0, 2.0, 4.0, 1.0, 1.0, 3.0)
+        self.assertAlmostEqual(lam, 3.0 * 4.0 / (np.sqrt(3.0) * 4.0))
+
+    def test_subsonic_and_sonic(self):
+        """Test that M < 1 gives NaN without a warning and M = 1 gives infinity"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertTrue(np.isnan(self.calc(2.0, 0.8, 4.0, 1.0, 1.0, 3.0)))
+        with np.errstate(divide='ignore'):
+            self.assertEqual(self.calc(2.0, 1.0, 4.0, 1.0, 1.0, 3.0), np.inf)
+
+    def test_scalar_stays_scalar(self):
+        """Test that scalar inputs give a scalar result"""
+        self.assertEqual(np.ndim(self.calc(2.0, 2.0, 4.0, 1.0, 1.0, 3.0)), 0)
+
+    def test_series_keeps_index(self):
+        """Test that a pandas Series keeps its index"""
+        import pandas as pd
+
+        mach = pd.Series([0.8, 2.0], index=["a", "b"])
+        lam = self.calc(2.0, mach, 4.0, 1.0, 1.0, 3.0)
+
+        self.assertIsInstance(lam, pd.Series)
+        self.assertEqual(list(lam.index), ["a", "b"])
+        self.assertTrue(np.isnan(lam["a"]))
+
+if __name__ == '__main__':
+    unittest.main()
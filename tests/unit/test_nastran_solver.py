@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for NASTRAN Solver
+=============================
+
+Tests for BDF/F06 file generation in simulation mode.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+current_dir = Path(__file__).parent.parent.parent
+src_dir = current_dir / "src"
+sys.path.insert(0, str(src_dir))
+
+class SamplePanel:
+    """Minimal panel definition accepted by the solver"""
+    length = 0.5
+    width = 0.3
+    thickness = 0.002
+    youngs_modulus = 71.7e9
+    poissons_ratio = 0.33
+    density = 2810.0
+
+class TestNastranSolver(unittest.TestCase):
+    """Test NASTRAN solver file generation"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        from analysis.nastran_solver import NastranSolver
+        self.solver = NastranSolver()
+        self.solver.simulation_mode = True
+        self.panel = SamplePanel()
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        self.solver.close()
+
+    def test_f06_content_is_ascii_bytes(self):
+        """Test that simulated F06 content is generated as ASCII bytes"""
+        content = self.solver._generate_f06_content(141.0, 19.5)
+
+        self.assertIsInstance(content, bytes)
+        text = content.decode('ascii')
+        self.assertIn("FLUTTER  SUMMARY", text)
+        self.assertIn("FLUTTER VELOCITY = 141.0 M/S AT 19.5 HZ", text)
+
+    def test_simulated_f06_roundtrip(self):
+        """Test that the simulated F06 can be parsed back into flutter results"""
+        from analysis.nastran_f06_parser import NastranF06Parser
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            bdf_path = Path(temp_dir) / "flutter.bdf"
+            self.solver._generate_text_bdf(bdf_path, self.panel)
+            f06_path = self.solver._simulate_nastran_execution(bdf_path)
+
+            self.assertTrue(f06_path.exists())
+            results = NastranF06Parser().parse_f06_file(str(f06_path))
+
+        self.assertEqual(len(results), 20)
+        velocities = [r.flutter_speed for r in results]
+        self.assertEqual(velocities, sorted(velocities))
+
+        # Damping crosses zero close to the simulated 2mm flutter speed
+        critical = NastranF06Parser().get_critical_flutter_point(results)
+        self.assertIsNotNone(critical)
+        self.assertLess(critical.damping, 0)
+        self.assertGreater(critical.flutter_speed, 100.0)
+        self.assertLess(critical.flutter_speed, 200.0)
+
+    def test_text_bdf_is_repeatable(self):
+        """Test that a repeated panel gives the same deck apart from the timestamp"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first, second = Path(temp_dir) / "a.bdf", Path(temp_dir) / "b.bdf"
+            self.solver._generate_text_bdf(first, self.panel)
+            self.solver._generate_text_bdf(second, self.panel)
+
+            strip = lambda path: [l for l in path.read_text().splitlines() if "Generated:" not in l]
+            self.assertEqual(strip(first), strip(second))
+
+    def test_f06_content_is_repeatable(self):
+        """Test that a repeated flutter point gives the same F06 apart from the timestamp"""
+        first = self.solver._generate_f06_content(150.0, 20.0)
+        second = self.solver._generate_f06_content(150.0, 20.0)
+
+        strip = lambda content: [l for l in content.splitlines() if b"CREATED ON" not in l]
+        self.assertEqual(strip(first), strip(second))
+
+    def test_analysis_without_saved_f06(self):
+        """Test that disabling save_f06 leaves no copy in the current directory"""
+        self.solver.config.save_f06 = False
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                results = self.solver.analyze_flutter(self.panel, None)
+            finally:
+                os.chdir(cwd)
+
+            self.assertEqual(os.listdir(temp_dir), [])
+        self.assertEqual(len(results), 20)
+
+    def test_working_directory_reused_and_cleared(self):
+        """Test that the working directory is emptied after a run and reused by the next"""
+        from analysis import nastran_solver
+
+        self.solver.config.save_f06 = False
+        first = self.solver.analyze_flutter(self.panel, None)
+        work_dir = self.solver.temp_dir
+
+        # Wait for the queued cleanup to run
+        nastran_solver._CLEANUP_EXECUTOR.submit(lambda: None).result()
+        self.assertEqual(os.listdir(work_dir), [])
+
+        second = self.solver.analyze_flutter(self.panel, None)
+        self.assertEqual(self.solver.temp_dir, work_dir)
+        self.assertEqual(len(second), len(first))
+
+        self.solver.close()
+        self.assertFalse(os.path.exists(work_dir))
+
+    def test_working_directory_removed_with_solver(self):
+        """Test that the working directory is removed when an unclosed solver is collected"""
+        import gc
+        from analysis.nastran_solver import NastranSolver
+
+        solver = NastranSolver()
+        solver.simulation_mode = True
+        solver.config.save_f06 = False
+        solver.analyze_flutter(self.panel, None)
+        work_dir = solver.temp_dir
+        self.assertTrue(os.path.isdir(work_dir))
+
+        del solver
+        gc.collect()
+        self.assertFalse(os.path.exists(work_dir))
+
+    def test_batch_analysis_matches_sequential(self):
+        """Test that concurrent batch analysis returns results in panel order"""
+        panels = []
+        for thickness in (0.0015, 0.002, 0.003):
+            panel = SamplePanel()
+            panel.thickness = thickness
+            panels.append(panel)
+
+        self.solver.config.save_f06 = False
+        self.solver.config.max_concurrent = 3
+        batch = self.solver.analyze_flutter_batch(panels)
+        sequential = [self.solver.analyze_flutter(panel, None) for panel in panels]
+
+        self.assertEqual(len(batch), 3)
+        for got, expected in zip(batch, sequential):
+            self.assertEqual([r.flutter_speed for r in got], [r.flutter_speed for r in expected])
+            self.assertEqual([r.damping for r in got], [r.damping for r in expected])
+
+    def test_batch_workers_do_not_share_bdf_generator(self):
+        """Test that each batch worker writes decks with its own BDF generator"""
+        from unittest import mock
+        from analysis import nastran_solver
+
+        class FlutterDeckGenerator:
+            def generate_flutter_bdf(self, **kwargs):
+                pass
+
+        with mock.patch.object(nastran_solver, "NastranBDFGenerator", FlutterDeckGenerator):
+            solver = nastran_solver.NastranSolver()
+            worker = solver._spawn_worker()
+
+        self.assertIsNotNone(worker._advanced_bdf_writer)
+        self.assertIsNot(worker._advanced_bdf_writer, solver._advanced_bdf_writer)
+
+    @unittest.skipIf(os.name == 'nt', "Shell script executables require POSIX")
+    def test_executable_probe_is_cached(self):
+        """Test that a valid executable is run only once across solver instances"""
+        from analysis.nastran_solver import NastranSolver, NastranConfig, NastranVersion
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            runs = Path(temp_dir) / "runs"
+            exe_path = Path(temp_dir) / "bin" / "nastran"
+            exe_path.parent.mkdir()
+            exe_path.write_text(f'#!/bin/sh\necho run >> {runs}\necho "MSC Nastran version"\n')
+            exe_path.chmod(0o755)
+
+            config = NastranConfig(nastran_paths=[str(Path(temp_dir) / "*" / "nastran")])
+            solver = NastranSolver(config)
+            second = NastranSolver(config)
+
+            self.assertEqual(solver.nastran_executable, str(exe_path))
+            self.assertEqual(second.nastran_executable, str(exe_path))
+            self.assertEqual(second.nastran_version, NastranVersion.MSC_NASTRAN)
+            self.assertFalse(second.simulation_mode)
+            self.assertEqual(runs.read_text().splitlines(), ["run"])
+
+    @unittest.skipIf(os.name == 'nt', "Shell script executables require POSIX")
+    def test_removed_executable_is_not_returned(self):
+        """Test that an executable removed after it was found is no longer used"""
+        from analysis.nastran_solver import NastranSolver, NastranConfig
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exe_path = Path(temp_dir) / "bin" / "nastran"
+            exe_path.parent.mkdir()
+            exe_path.write_text('#!/bin/sh\necho "MSC Nastran"\n')
+            exe_path.chmod(0o755)
+            config = NastranConfig(nastran_paths=[str(Path(temp_dir) / "*" / "nastran")])
+
+            self.assertEqual(NastranSolver(config).nastran_executable, str(exe_path))
+
+            exe_path.unlink()
+            solver = NastranSolver(config)
+            self.assertTrue(solver.simulation_mode)
+            self.assertNotEqual(solver.nastran_executable, str(exe_path))
+
+    @unittest.skipIf(os.name == 'nt', "Shell script executables require POSIX")
+    def test_failed_probe_is_retried(self):
+        """Test that an executable failing its probe is accepted once it answers"""
+        from analysis.nastran_solver import NastranSolver, NastranConfig
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exe_path = Path(temp_dir) / "nastran"
+            exe_path.write_text('#!/bin/sh\necho "starting"\n')
+            exe_path.chmod(0o755)
+            config = NastranConfig(nastran_paths=[str(exe_path)])
+
+            self.assertTrue(NastranSolver(config).simulation_mode)
+
+            exe_path.write_text('#!/bin/sh\necho "MSC Nastran"\n')
+            solver = NastranSolver(config)
+            self.assertFalse(solver.simulation_mode)
+            self.assertEqual(solver.nastran_executable, str(exe_path))
+
+    @unittest.skipIf(os.name == 'nt', "Shell script executables require POSIX")
+    def test_executable_priority_order(self):
+        """Test that concurrent probing still returns the first valid search path"""
+        from analysis.nastran_solver import _resolve_nastran
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            scripts = {"a": 'echo "usage"', "b": 'sleep 0.5; echo "NX Nastran"',
+                       "c": 'echo "MSC Nastran"'}
+            paths = []
+            for name, body in scripts.items():
+                exe_path = Path(temp_dir) / name / "nastran"
+                exe_path.parent.mkdir()
+                exe_path.write_text(f'#!/bin/sh\n{body}\n')
+                exe_path.chmod(0o755)
+                paths.append(str(exe_path))
+
+            missing = str(Path(temp_dir) / "missing" / "nastran")
+            self.assertEqual(_resolve_nastran(tuple([missing] + paths)), paths[1])
+            self.assertIsNone(_resolve_nastran((missing, paths[0])))
+
+    @unittest.skipIf(os.name == 'nt', "Shell script executables require POSIX")
+    def test_lower_priority_candidates_not_started(self):
+        """Test that only the first candidate is run when it is valid"""
+        from analysis.nastran_solver import _search_nastran
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            marker = Path(temp_dir) / "second_started"
+            first = Path(temp_dir) / "first"
+            second = Path(temp_dir) / "second"
+            first.write_text('#!/bin/sh\necho "MSC Nastran"\n')
+            second.write_text(f'#!/bin/sh\ntouch {marker}\necho "NX Nastran"\n')
+            for exe_path in (first, second):
+                exe_path.chmod(0o755)
+
+            paths = (str(first), str(first), str(second))
+            self.assertEqual(_search_nastran(paths), str(first))
+            self.assertFalse(marker.exists())
+
+    @unittest.skipIf(os.name == 'nt', "Shell script executables require POSIX")
+    def test_version_taken_from_probe_output(self):
+        """Test that the version is read from the validation probe without running -v"""
+        from analysis import nastran_solver
+        from analysis.nastran_solver import NastranVersion
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            marker = Path(temp_dir) / "version_queried"
+            exe_path = Path(temp_dir) / "solver"
+            exe_path.write_text(f'#!/bin/sh\n[ "$1" = "-v" ] && touch {marker}\n'
+                                'echo "MSC Nastran 2021"\n')
+            exe_path.chmod(0o755)
+            real_path = os.path.realpath(exe_path)
+
+            self.assertTrue(nastran_solver._probe_nastran_executable(real_path))
+            self.assertEqual(nastran_solver._detect_version_from_output(real_path),
+                             NastranVersion.MSC_NASTRAN)
+            self.assertFalse(marker.exists())
+
+    @unittest.skipIf(os.name == 'nt', "Shell script executables require POSIX")
+    def test_validate_executable_without_probe(self):
+        """Test that only strict validation runs the executable"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            exe_path = Path(temp_dir) / "nastran"
+            exe_path.write_text('#!/bin/sh\necho "usage"\n')
+            exe_path.chmod(0o755)
+
+            self.assertTrue(self.solver._validate_nastran_executable(str(exe_path)))
+            self.assertFalse(self.solver._validate_nastran_executable(str(exe_path), strict=True))
+            self.assertFalse(self.solver._validate_nastran_executable(str(exe_path) + ".missing"))
+
+    def test_list_nastran_outputs(self):
+        """Test that output files of the job are found with one directory scan"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            work_dir = Path(temp_dir)
+            for name in ("flutter.bdf", "flutter.op2", "flutter.f06", "other.f06"):
+                (work_dir / name).write_text("")
+            (work_dir / "flutter.log").mkdir()
+
+            outputs = self.solver._list_nastran_outputs(work_dir, "flutter")
+            self.assertEqual(outputs, ["flutter.f06", "flutter.op2"])
+            self.assertTrue(self.solver._check_nastran_output(work_dir, "flutter"))
+            self.assertFalse(self.solver._check_nastran_output(work_dir, "missing"))
+
+    def test_convert_to_f06_copies_file(self):
+        """Test the output copy keeps contents and timestamps, with and without copy_file_range"""
+        from unittest import mock
+        from analysis import nastran_solver
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            op2_path = Path(temp_dir) / "flutter.op2"
+            op2_path.write_bytes(b"OUTPUT" * 100000)
+            os.utime(op2_path, (1e9, 1e9))
+
+            f06_path = self.solver._convert_to_f06(op2_path)
+            self.assertEqual(f06_path.read_bytes(), op2_path.read_bytes())
+            self.assertEqual(f06_path.stat().st_mtime, 1e9)
+
+            f06_path.unlink()
+            with mock.patch.object(nastran_solver.os, "copy_file_range",
+                                   side_effect=OSError(18, "Invalid cross-device link"),
+                                   create=True):
+                f06_path = self.solver._convert_to_f06(op2_path)
+            self.assertEqual(f06_path.read_bytes(), op2_path.read_bytes())
+            self.assertEqual(f06_path.stat().st_mtime, 1e9)
+
+    def test_fast_copy_falls_back_when_nothing_copied(self):
+        """Test that a copy_file_range returning 0 early does not leave a truncated copy"""
+        from unittest import mock
+        from analysis import nastran_solver
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src_path = Path(temp_dir) / "flutter.f06"
+            dst_path = Path(temp_dir) / "saved.f06"
+            src_path.write_bytes(b"FLUTTER" * 100000)
+
+            with mock.patch.object(nastran_solver.os, "copy_file_range",
+                                   return_value=0, create=True):
+                nastran_solver._fast_copy(src_path, dst_path)
+            self.assertEqual(dst_path.read_bytes(), src_path.read_bytes())
+
+    @unittest.skipIf(os.name == 'nt', "Shell script executables require POSIX")
+    def test_streaming_run_stops_on_fatal(self):
+        """Test that a run is stopped as soon as a fatal message is printed"""
+        import time
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script = Path(temp_dir) / "nastran"
+            script.write_text('#!/bin/sh\necho "*** USER FATAL MESSAGE 316"\nsleep 30\n')
+            script.chmod(0o755)
+
+            start = time.time()
+            with self.assertRaises(RuntimeError):
+                self.solver._run_streaming([str(script)], Path(temp_dir))
+            self.assertLess(time.time() - start, 10)
+
+    @unittest.skipIf(os.name == 'nt', "Shell script executables require POSIX")
+    def test_streaming_run_ignores_fatal_mentions(self):
+        """Test that lines merely mentioning fatal messages do not stop the run"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script = Path(temp_dir) / "nastran"
+            script.write_text('#!/bin/sh\necho "FATAL ERROR HANDLING: ON"\n'
+                              'echo "  0 FATAL MESSAGES"\necho "NASTRAN done"\n')
+            script.chmod(0o755)
+
+            output = self.solver._run_streaming([str(script)], Path(temp_dir))
+
+        self.assertTrue(output.endswith("NASTRAN done\n"))
+
+    @unittest.skipIf(os.name == 'nt', "Shell script executables require POSIX")
+    def test_streaming_run_logs_output(self):
+        """Test that console lines reach the debug log as they are read"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script = Path(temp_dir) / "nastran"
+            script.write_text('#!/bin/sh\necho "NASTRAN started"\necho "NASTRAN done" >&2\n')
+            script.chmod(0o755)
+
+            with self.assertLogs(self.solver.logger, level='DEBUG') as logs:
+                output = self.solver._run_streaming([str(script)], Path(temp_dir))
+
+        self.assertEqual(output, "NASTRAN started\nNASTRAN done\n")
+        self.assertIn("NASTRAN: NASTRAN done", "\n".join(logs.output))
+
+    @unittest.skipIf(os.name == 'nt', "Shell script executables require POSIX")
+    def test_streaming_run_timeout(self):
+        """Test that cpu_time is enforced while output is streamed"""
+        import subprocess
+
+        self.solver.config.cpu_time = 1
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script = Path(temp_dir) / "nastran"
+            script.write_text('#!/bin/sh\necho "NASTRAN started"\nsleep 30\n')
+            script.chmod(0o755)
+
+            with self.assertRaises(subprocess.TimeoutExpired) as ctx:
+                self.solver._run_streaming([str(script)], Path(temp_dir))
+            self.assertIn("NASTRAN started", ctx.exception.output)
+
+if __name__ == '__main__':
+    unittest.main()